@@ -0,0 +1,41 @@
+# benchmarks/bench_crc.py
+"""
+CRC修正的微基准测试。
+
+对比单次 CRC 修正的开销与对同一数据做一次 crc32 计算的开销。
+用法: python benchmarks/bench_crc.py [数据大小(KB)] [重复次数]
+"""
+
+import os
+import sys
+import timeit
+import zlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils import CRCUtils  # noqa: E402
+
+
+def main():
+    size_kb = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    number = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    original = os.urandom(size_kb * 1024)
+    modified = os.urandom(size_kb * 1024)
+    original_crc = zlib.crc32(original)
+    modified_crc = zlib.crc32(modified)
+
+    def bench(label, func):
+        seconds = min(timeit.repeat(func, number=number, repeat=5)) / number
+        print(f"{label:<28} {seconds * 1e6:10.2f} us")
+
+    print(f"data size: {size_kb} KB, {number} calls per run")
+    bench("crc32 (single pass)", lambda: zlib.crc32(modified))
+    bench("correction bytes only", lambda: CRCUtils._compute_correction_bytes(original_crc, modified_crc))
+    bench("fix suffix (from CRCs)", lambda: CRCUtils.compute_crc_fix_suffix(original_crc, modified_crc))
+    bench("apply_crc_fix (full)", lambda: CRCUtils.apply_crc_fix(original, modified))
+
+
+if __name__ == "__main__":
+    main()
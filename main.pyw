@@ -1,9 +1,14 @@
 # main.py
 
+import multiprocessing
+
 from tkinterdnd2 import TkinterDnD
 from ui import App
 
 if __name__ == "__main__":
+    # 打包后的程序需要此调用才能正确启动批量处理的工作进程
+    multiprocessing.freeze_support()
+
     # 使用 TkinterDnD.Tk() 作为主窗口以支持拖放
     root = TkinterDnD.Tk()
     
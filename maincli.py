@@ -80,7 +80,11 @@ def handle_update(args: argparse.Namespace, logger) -> None:
     save_options = processing.SaveOptions(
         perform_crc=not args.no_crc,
         enable_padding=args.padding,
-        compression=args.compression
+        compression=args.compression,
+        compress_workers=args.workers,
+        lzma_parallel_blocks=args.lzma_parallel_blocks,
+        encode_workers=args.workers,
+        texture_cache=not args.no_texture_cache
     )
     
     spine_options = processing.SpineOptions(
@@ -151,6 +155,9 @@ Examples:
         choices=['lzma', 'lz4', 'original', 'none'],
         help='Compression method for Bundle files (Default: lzma). Options: lzma, lz4, original (keep original), none (no compression).'
     )
+    saving_group.add_argument('--workers', type=int, default=1, help='Number of workers used to encode textures and compress LZ4 bundle blocks in parallel (Default: 1).')
+    saving_group.add_argument('--lzma-parallel-blocks', action='store_true', help='Split LZMA data into multiple blocks so it can be compressed in parallel with --workers. This changes the block layout of the output file; by default only LZ4 is compressed in parallel.')
+    saving_group.add_argument('--no-texture-cache', action='store_true', help='Do not read or write the encoded texture cache (texture_cache/).')
 
     # --- Spine 转换参数 ---
     spine_group = update_parser.add_argument_group('Spine Conversion Options')
@@ -184,7 +191,11 @@ def handle_asset_packing(args: argparse.Namespace, logger) -> None:
     save_options = processing.SaveOptions(
         perform_crc=not args.no_crc,
         enable_padding=False,
-        compression=args.compression
+        compression=args.compression,
+        compress_workers=args.workers,
+        lzma_parallel_blocks=args.lzma_parallel_blocks,
+        encode_workers=args.workers,
+        texture_cache=not args.no_texture_cache
     )
 
     # 调用核心处理函数
@@ -194,7 +205,8 @@ def handle_asset_packing(args: argparse.Namespace, logger) -> None:
         output_dir=output_dir,
         save_options=save_options,
         spine_options=None,
-        log=logger.log
+        log=logger.log,
+        lazy_images=args.lazy_images
     )
 
     logger.log("\n" + "="*50)
@@ -224,8 +236,89 @@ Example:
         choices=['lzma', 'lz4', 'original', 'none'],
         help='Compression method for Bundle files (Default: lzma). Options: lzma, lz4, original (keep original), none (no compression).'
     )
+    pack_parser.add_argument('--workers', type=int, default=1, help='Number of workers used to encode textures and compress LZ4 bundle blocks in parallel (Default: 1).')
+    pack_parser.add_argument('--lazy-images', action='store_true', help='Decode PNG files only when a matching texture is found in the bundle.')
+    pack_parser.add_argument('--lzma-parallel-blocks', action='store_true', help='Split LZMA data into multiple blocks so it can be compressed in parallel with --workers. This changes the block layout of the output file; by default only LZ4 is compressed in parallel.')
+    pack_parser.add_argument('--no-texture-cache', action='store_true', help='Do not read or write the encoded texture cache (texture_cache/).')
     pack_parser.set_defaults(func=handle_asset_packing)
 
+# ====== Asset Extractor ======
+
+def handle_asset_extraction(args: argparse.Namespace, logger) -> None:
+    """处理 'extract' 命令的逻辑。"""
+    logger.log("--- Start Asset Extraction ---")
+
+    output_dir = Path(args.output_dir)
+
+    asset_types = set(args.asset_types)
+    logger.log(f"Specified asset extraction types: {', '.join(asset_types)}")
+
+    # 多个 bundle 并行提取时每个进程内不再并行导出贴图；只有一个 bundle 时用于并行导出贴图
+    extract_options = processing.ExtractOptions(
+        workers=args.workers,
+        texture_format=args.texture_format,
+        png_compress_level=args.png_level,
+        incremental=args.incremental,
+        name_filter=args.name_filter
+    )
+
+    # 调用核心处理函数
+    success_count, fail_count, failed_tasks = processing.process_bulk_asset_extraction(
+        bundle_source=args.source,
+        output_dir=output_dir,
+        asset_types_to_extract=asset_types,
+        downgrade_options=None,
+        log=logger.log,
+        max_workers=args.workers,
+        extract_options=extract_options
+    )
+
+    if success_count + fail_count == 0:
+        logger.log(f"❌ Error: No bundle files found in '{args.source}'.")
+        return
+
+    logger.log("\n" + "="*50)
+    logger.log(f"Extraction finished: {success_count} succeeded, {fail_count} failed.")
+    for task in failed_tasks:
+        logger.log(f"  ❌ {task}")
+
+def setup_asset_extractor_parser(subparsers: argparse._SubParsersAction) -> None:
+    """为 'extract' 命令配置参数解析器。"""
+    extract_parser = subparsers.add_parser(
+        'extract',
+        help='Extract assets from all bundle files in a directory or matching a glob pattern.',
+        formatter_class=argparse.RawTextHelpFormatter,
+        description='''
+Examples:
+  # Extract all textures and text assets from a game resource directory
+  python maincli.py extract --source "C:\\path\\to\\GameData\\Windows" --output-dir "C:\\path\\to\\output" --workers 8
+
+  # Extract Spine assets of a character as raw RGBA, skipping unchanged assets
+  python maincli.py extract --source "C:\\path\\to\\GameData\\Windows\\*spinecharacters-ch0001*.bundle" \
+--name-filter "ch0001*" --texture-format rgba --incremental
+'''
+    )
+    extract_parser.add_argument('--source', required=True, help='Directory containing bundle files (searched recursively), or a glob pattern matching bundle files.')
+    extract_parser.add_argument('--output-dir', default='./output/', help='Directory to save extracted assets, one subdirectory per bundle (Default: ./output/).')
+    extract_parser.add_argument(
+        '--asset-types',
+        nargs='+',
+        default=['Texture2D', 'TextAsset'],
+        choices=['Texture2D', 'TextAsset'],
+        help='List of asset types to extract. (Default: %(default)s)'
+    )
+    extract_parser.add_argument('--name-filter', help='Only extract assets whose name matches this wildcard pattern (case-insensitive), e.g. "ch0001*".')
+    extract_parser.add_argument(
+        '--texture-format',
+        default='png',
+        choices=['png', 'rgba', 'qoi', 'tga', 'raw'],
+        help='Output format for textures (Default: png). raw dumps the original encoded texture data as .tex files.'
+    )
+    extract_parser.add_argument('--png-level', type=int, default=6, choices=range(10), metavar='0-9', help='PNG compression level, 1 is fastest and 9 is smallest (Default: 6).')
+    extract_parser.add_argument('--incremental', action='store_true', help='Skip assets that are unchanged since the last extraction into the same output directory.')
+    extract_parser.add_argument('--workers', type=int, default=1, help='Number of bundle files extracted in parallel, or of textures exported in parallel for a single bundle (Default: 1).')
+    extract_parser.set_defaults(func=handle_asset_extraction)
+
 # ====== CRC Tool ======
 
 def handle_crc(args: argparse.Namespace, logger) -> None:
@@ -263,13 +356,11 @@ def handle_crc(args: argparse.Namespace, logger) -> None:
     # --- 模式 1: 仅检查/计算 CRC ---
     if args.check_only:
         try:
-            with open(modified_path, "rb") as f: modified_data = f.read()
-            modified_crc_hex = f"{CRCUtils.compute_crc32(modified_data):08X}"
+            modified_crc_hex = f"{CRCUtils.get_file_crc32(modified_path):08X}"
             logger.log(f"Modified File CRC32: {modified_crc_hex}  ({modified_path.name})")
 
             if original_path:
-                with open(original_path, "rb") as f: original_data = f.read()
-                original_crc_hex = f"{CRCUtils.compute_crc32(original_data):08X}"
+                original_crc_hex = f"{CRCUtils.get_file_crc32(original_path):08X}"
                 logger.log(f"Original File CRC32: {original_crc_hex}  ({original_path.name})")
                 if original_crc_hex == modified_crc_hex:
                     logger.log("✅ CRC Match: Yes")
@@ -361,6 +452,7 @@ def main() -> None:
     # 配置各个子命令的解析器
     setup_update_parser(subparsers)
     setup_asset_packer_parser(subparsers)
+    setup_asset_extractor_parser(subparsers)
     setup_crc_parser(subparsers)
     setup_env_parser(subparsers)
 
@@ -2,18 +2,33 @@
 
 import UnityPy
 from UnityPy.enums import ClassIDType as AssetType
+from UnityPy.enums import CompressionFlags
+from UnityPy.files import BundleFile
+from UnityPy.helpers import CompressionHelper
+from UnityPy.streams import EndianBinaryReader, EndianBinaryWriter
 import os
+import mmap
 import traceback
 from pathlib import Path
 from PIL import Image
 import shutil
 import re
+import fnmatch
+import glob
 import tempfile
 import subprocess
-from dataclasses import dataclass
+import sqlite3
+import hashlib
+import json
+import struct
+from contextlib import closing, nullcontext
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import partial
 from typing import Callable, Any, Literal
 
-from i18n import t
+from i18n import t, i18n_manager
 from utils import CRCUtils, no_log, get_skel_version
 
 # -------- 类型别名 ---------
@@ -26,11 +41,38 @@ AssetKey 表示资源的唯一标识符，在不同的流程中可以使用不
 """
 AssetKey = str | int | tuple[str, str]
 
-# 资源的具体内容，可以是字节数据、PIL图像或None
-AssetContent = bytes | Image.Image | None  
-
-# 从对象生成资源键的函数，接收UnityPy对象和一个额外参数，返回该资源的键
-KeyGeneratorFunc = Callable[[UnityPy.classes.Object, Any], AssetKey]
+class LazyAssetContent:
+    """
+    延迟加载的资源内容。
+    只保存加载函数和资源类型，在替换真正匹配到该资源时才读取并解码（例如贴图的图像数据），
+    因此替换清单占用的内存只与实际被替换的资源有关。
+    加载结果会被保留，同一份清单应用到多个目标时不会重复解码。
+    source 是内容来源的 UnityPy 对象或原始贴图文件 (.tex) 的数据（如果有），可以用于直接复制已编码的贴图数据。
+    """
+    def __init__(
+        self,
+        loader: Callable[[], bytes | Image.Image],
+        asset_type: str,
+        source: "UnityPy.classes.Object | EncodedTexture | None" = None,
+    ):
+        self.asset_type = asset_type
+        self.source = source
+        self._loader: Callable[[], bytes | Image.Image] | None = loader
+        self._content: bytes | Image.Image | None = None
+
+    def load(self) -> bytes | Image.Image:
+        if self._loader is not None:
+            self._content = self._loader()
+            # 加载后释放对源对象的引用
+            self._loader = None
+        return self._content
+
+# 资源的具体内容，可以是字节数据、PIL图像、延迟加载的内容或None
+AssetContent = bytes | Image.Image | LazyAssetContent | None  
+
+# 从对象生成资源键的函数，接收UnityPy对象，返回该资源的键
+# 只在需要时才读取对象内容，例如 path_id 策略完全不需要读取对象
+KeyGeneratorFunc = Callable[[UnityPy.classes.Object], AssetKey | None]
 
 # 日志函数类型
 LogFunc = Callable[[str], None]  
@@ -38,12 +80,46 @@ LogFunc = Callable[[str], None]
 # 压缩类型
 CompressionType = Literal["lzma", "lz4", "original", "none"]  
 
+"""
+提取贴图时可选的输出格式，资源打包工具可以读取所有这些格式：
+    png  - PNG 图片（默认）
+    rgba - 未压缩的 RGBA 像素数据，带有记录尺寸的文件头
+    qoi  - QOI 图片，编码和解码都比 PNG 快得多
+    tga  - 未压缩的 TGA 图片
+    raw  - 贴图原始的编码数据，不解码；打包回格式、尺寸相同的贴图时直接写入，不需要重新编码
+"""
+TextureFileFormat = Literal["png", "rgba", "qoi", "tga", "raw"]
+
 @dataclass
 class SaveOptions:
     """封装了保存、压缩和CRC修正相关的选项。"""
     perform_crc: bool = True
     enable_padding: bool = False
     compression: CompressionType = "lzma"
+    # 压缩 bundle 数据块时使用的线程数，大于1时并行压缩（默认只对 LZ4 生效）
+    compress_workers: int = 1
+    # 并行压缩时是否将 LZMA 数据拆分为多个数据块，会改变输出文件的数据块布局
+    lzma_parallel_blocks: bool = False
+    # 编码贴图时使用的进程数（以及读取图片时使用的线程数），大于1时并行处理
+    encode_workers: int = 1
+    # 是否使用已编码贴图的磁盘缓存 (texture_cache)
+    texture_cache: bool = True
+
+@dataclass
+class ExtractOptions:
+    """封装了资源提取相关的选项。"""
+    # 解码贴图并编码为 PNG 时使用的进程数，大于1时并行处理
+    workers: int = 1
+    # 贴图的输出格式，见 TextureFileFormat；png 以外的格式都不需要耗时的压缩
+    texture_format: TextureFileFormat = "png"
+    # PNG 压缩等级 (0-9)，1 速度最快，9 文件最小
+    png_compress_level: int = 6
+    # 是否额外优化 PNG 文件大小，速度更慢
+    png_optimize: bool = False
+    # 增量提取：在输出目录中记录每个资源的原始数据哈希，再次提取时跳过未变化的资源
+    incremental: bool = False
+    # 资源名称过滤，使用通配符（如 "ch0001*"），不区分大小写；为 None 时提取所有资源
+    name_filter: str | None = None
 
 @dataclass
 class SpineOptions:
@@ -84,13 +160,33 @@ class SpineDowngradeOptions:
 
 # ====== 读取与保存相关 ======
 
+def _read_unityfs_size(data: bytes | memoryview) -> int | None:
+    """
+    读取 UnityFS 文件头中记录的文件总大小。
+    文件头结构: "UnityFS\\0", 格式版本(u32), 播放器版本字符串, 引擎版本字符串, 文件总大小(i64, 大端序)。
+    如果不是 UnityFS 文件或文件头不完整，返回 None。
+    """
+    header = bytes(data[:256])
+    if not header.startswith(b"UnityFS\x00"):
+        return None
+    try:
+        pos = 12
+        for _ in range(2):
+            pos = header.index(b"\x00", pos) + 1
+    except ValueError:
+        return None
+    if pos + 8 > len(header):
+        return None
+    return int.from_bytes(header[pos:pos + 8], "big")
+
 def load_bundle(
     bundle_path: Path,
     log: LogFunc = no_log
 ) -> UnityPy.Environment | None:
     """
     尝试加载一个 Unity bundle 文件。
-    如果直接加载失败，会尝试移除末尾的几个字节后再次加载。
+    如果直接加载失败，会尝试移除末尾的几个字节（CRC修正时附加的数据）后再次加载。
+    此时文件会被映射到内存中，每次尝试只创建零拷贝的视图，不会复制文件内容。
     """
 
     # 1. 尝试直接加载
@@ -100,17 +196,82 @@ def load_bundle(
     except Exception as e:
         pass
 
-    # 如果直接加载失败，读取文件内容到内存
+    # 如果直接加载失败，将文件映射到内存
+    # 映射会被加载结果中的视图引用，随 env 一起释放
+    data = _map_bundle_file(bundle_path, log)
+    if data is None:
+        return None
+
+    return _load_trimmed_bundle(data, bundle_path, log)
+
+def load_bundle_with_crc(
+    bundle_path: Path,
+    log: LogFunc = no_log,
+    compute_crc: bool = True,
+) -> tuple[UnityPy.Environment | None, int | None]:
+    """
+    加载一个 Unity bundle 文件，同时返回该文件的CRC32值。
+    文件只被映射到内存读取一次，CRC直接从加载使用的同一份数据计算（缓存命中时直接使用缓存值），
+    之后保存并修正CRC时无需再次读取原始文件。
+    compute_crc 为 False 时（保存时不修正CRC）不计算也不缓存CRC，返回的 crc 为 None。
+    返回 (env, crc) 的元组，加载失败时 env 为 None。
+    """
+    crc = None
+    cache = CRCUtils.get_crc_cache()
+    if compute_crc:
+        try:
+            crc = cache.lookup(bundle_path)
+        except OSError:
+            crc = None
+
+    data = _map_bundle_file(bundle_path, log)
+    if data is None:
+        return None, None
+
+    if compute_crc and crc is None:
+        crc = CRCUtils.compute_crc32(data)
+        cache.store(bundle_path, crc)
+
+    # 1. 尝试直接加载
+    try:
+        return UnityPy.load(data), crc
+    except Exception as e:
+        pass
+
+    return _load_trimmed_bundle(data, bundle_path, log), crc
+
+def _map_bundle_file(
+    bundle_path: Path,
+    log: LogFunc = no_log
+) -> memoryview | None:
+    """
+    将文件只读映射到内存，返回其视图。失败时返回 None。
+    """
     try:
         with open(bundle_path, "rb") as f:
-            data = f.read()
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
     except Exception as e:
         log(f'  ❌ {t("log.file.read_in_memory_failed", name=bundle_path.name, error=e)}')
         return None
 
+def _load_trimmed_bundle(
+    data: memoryview,
+    bundle_path: Path,
+    log: LogFunc = no_log
+) -> UnityPy.Environment | None:
+    """
+    依次尝试移除数据末尾的几个字节（CRC修正时附加的数据）后加载 bundle。
+    每次尝试只创建零拷贝的视图，不会复制数据。
+    """
     # 定义加载策略：字节移除数量
     bytes_to_remove = [4, 8, 12]
 
+    # 文件头中记录了 bundle 的实际大小，据此可以直接确定末尾附加的字节数，优先尝试
+    declared_size = _read_unityfs_size(data)
+    if declared_size is not None and (len(data) - declared_size) in bytes_to_remove:
+        bytes_to_remove.remove(len(data) - declared_size)
+        bytes_to_remove.insert(0, len(data) - declared_size)
+
     # 2. 依次尝试不同的加载策略
     for bytes_num in bytes_to_remove:
         if len(data) > bytes_num:
@@ -165,10 +326,141 @@ def save_bundle(
         log(traceback.format_exc())
         return False
 
+# 启用 lzma_parallel_blocks 时 LZMA 数据块的大小。
+# UnityPy 将 LZMA 数据作为一整个数据块压缩，无法并行，因此只有显式启用时才按此大小拆分为多个数据块。
+# 不超过此大小的 bundle 仍然只有一个数据块，输出与串行压缩完全相同。
+LZMA_PARALLEL_BLOCK_SIZE = 0x800000
+
+def _compress_blocks_parallel(
+    data: bytes,
+    block_info_flag: int,
+    workers: int,
+) -> tuple[bytes, list[tuple[int, int, int]]]:
+    """
+    将 bundle 数据按块拆分并使用线程池并行压缩（lzma 和 lz4 压缩时会释放 GIL）。
+    分块方式与 UnityPy 的 CompressionHelper.chunk_based_compress 一致（LZMA 除外，见 LZMA_PARALLEL_BLOCK_SIZE），
+    因此 LZ4 的输出与串行压缩完全相同。
+
+    Returns:
+        (压缩后的数据, [(未压缩大小, 压缩后大小, 块标志), ...]) 的元组。
+    """
+    switch = block_info_flag & 0x3F
+    compress_func = CompressionHelper.COMPRESSION_MAP[switch]
+    if switch == CompressionFlags.LZMA:
+        chunk_size = LZMA_PARALLEL_BLOCK_SIZE
+    else:
+        chunk_size = CompressionHelper.COMPRESSION_CHUNK_SIZE_MAP[switch]
+
+    view = memoryview(data)
+    chunks = [view[pos:pos + chunk_size] for pos in range(0, len(data), chunk_size)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        compressed_chunks = list(executor.map(compress_func, chunks))
+
+    compressed_data = bytearray()
+    block_info: list[tuple[int, int, int]] = []
+    for chunk, compressed in zip(chunks, compressed_chunks):
+        # 压缩后反而变大的数据块按原样保存，并去掉块标志中的压缩类型
+        if len(compressed) > len(chunk):
+            compressed_data.extend(chunk)
+            block_info.append((len(chunk), len(chunk), block_info_flag ^ switch))
+        else:
+            compressed_data.extend(compressed)
+            block_info.append((len(chunk), len(compressed), block_info_flag))
+    return bytes(compressed_data), block_info
+
+def _save_unityfs_parallel(
+    bundle: BundleFile,
+    data_flag: int,
+    block_info_flag: int,
+    workers: int,
+) -> bytes:
+    """
+    按照 UnityPy 的 BundleFile.save_fs 写出 UnityFS 文件，只是数据块改为并行压缩。
+    文件结构: 文件头 -> (压缩后的) 块信息表与目录 -> 压缩后的数据块。
+    """
+    # 拼接 bundle 内所有文件的数据
+    data_writer = EndianBinaryWriter()
+    files = [
+        (
+            name,
+            f.flags,
+            data_writer.write_bytes(
+                f.bytes if isinstance(f, (EndianBinaryReader, EndianBinaryWriter)) else f.save()
+            ),
+        )
+        for name, f in bundle.files.items()
+    ]
+    file_data = data_writer.bytes
+    data_writer.dispose()
+
+    # 不进行加密，去掉加密标志
+    encryption_flag = bundle.dataflags.UsesAssetBundleEncryption
+    block_info_flag &= ~encryption_flag
+    data_flag &= ~encryption_flag
+
+    file_data, block_info = _compress_blocks_parallel(file_data, block_info_flag, workers)
+
+    # 块信息表: 未压缩数据的哈希(留空), 数据块列表, 目录
+    block_writer = EndianBinaryWriter(b"\x00" * 0x10)
+    block_writer.write_int(len(block_info))
+    for block_uncompressed_size, block_compressed_size, block_flag in block_info:
+        block_writer.write_u_int(block_uncompressed_size)
+        block_writer.write_u_int(block_compressed_size)
+        block_writer.write_u_short(block_flag)
+
+    block_writer.write_int(len(files))
+    offset = 0
+    for file_name, file_flag, file_size in files:
+        block_writer.write_long(offset)
+        block_writer.write_long(file_size)
+        offset += file_size
+        block_writer.write_u_int(file_flag)
+        block_writer.write_string_to_null(file_name)
+
+    block_data = block_writer.bytes
+    block_writer.dispose()
+    uncompressed_block_data_size = len(block_data)
+    block_data = CompressionHelper.COMPRESSION_MAP[data_flag & 0x3F](block_data)
+
+    # 文件头，文件总大小在最后回填
+    writer = EndianBinaryWriter()
+    writer.write_string_to_null(bundle.signature)
+    writer.write_u_int(bundle.version)
+    writer.write_string_to_null(bundle.version_player)
+    writer.write_string_to_null(bundle.version_engine)
+
+    header_pos = writer.Position
+    writer.write_long(0)
+    writer.write_u_int(len(block_data))
+    writer.write_u_int(uncompressed_block_data_size)
+    writer.write_u_int(data_flag)
+
+    if bundle._uses_block_alignment:
+        writer.align_stream(16)
+
+    if data_flag & 0x80:  # 块信息表位于文件末尾
+        if data_flag & 0x200:
+            writer.align_stream(16)
+        writer.write(file_data)
+        writer.write(block_data)
+    else:
+        writer.write(block_data)
+        if data_flag & 0x200:
+            writer.align_stream(16)
+        writer.write(file_data)
+
+    end_pos = writer.Position
+    writer.Position = header_pos
+    writer.write_long(end_pos)
+    writer.Position = end_pos
+    return writer.bytes
+
 def compress_bundle(
     env: UnityPy.Environment,
     compression: CompressionType = "none",
     log: LogFunc = no_log,
+    workers: int = 1,
+    lzma_parallel_blocks: bool = False,
 ) -> bytes:
     """
     从 UnityPy.Environment 对象生成 bundle 文件的字节数据。
@@ -177,6 +469,9 @@ def compress_bundle(
                  - "lz4": 使用 LZ4 压缩。
                  - "original": 保留原始压缩方式。
                  - "none": 不进行压缩。
+    workers: 压缩数据块时使用的线程数，大于1时对 UnityFS 文件的数据块进行并行压缩。
+    lzma_parallel_blocks: 为 True 时 LZMA 压缩也并行进行，数据会被拆分为多个数据块；
+                          否则 LZMA 仍按 UnityPy 的方式作为一整个数据块压缩。
     """
     save_kwargs = {}
     if compression == "original":
@@ -186,6 +481,14 @@ def compress_bundle(
         save_kwargs['packer'] = ""  # An empty string typically means no compression.
     else:
         save_kwargs['packer'] = compression
+
+    bundle = env.file
+    if workers > 1 and isinstance(bundle, BundleFile) and bundle.signature == "UnityFS":
+        # 与 BundleFile.save 中各压缩方式对应的 (data_flag, block_info_flag)
+        # LZMA 只有在允许拆分数据块时才能并行压缩
+        flags = {"lzma": (65, 1), "lz4": (194, 2)}.get(compression)
+        if flags and (compression != "lzma" or lzma_parallel_blocks):
+            return _save_unityfs_parallel(bundle, *flags, workers)
     
     return env.file.save(**save_kwargs)
 
@@ -195,10 +498,12 @@ def _save_and_crc(
     original_bundle_path: Path,
     save_options: SaveOptions,
     log: LogFunc = no_log,
+    original_crc: int | None = None,
 ) -> tuple[bool, str]:
     """
     一个辅助函数，用于生成压缩bundle数据，根据需要执行CRC修正，并最终保存到文件。
     封装了保存、CRC修正的逻辑。
+    如果提供了 original_crc（通常在加载原始文件时已经计算），CRC修正时不再读取原始文件。
 
     Returns:
         tuple(bool, str): (是否成功, 状态消息) 的元组。
@@ -216,30 +521,32 @@ def _save_and_crc(
         log(f"  > {t('log.file.saving_bundle', compression=compression_str, crc_status=crc_status_str)}")
 
         # 从 env 生成修改后的压缩 bundle 数据
-        modified_data = compress_bundle(env, save_options.compression, log)
+        modified_data = compress_bundle(
+            env, save_options.compression, log, save_options.compress_workers, save_options.lzma_parallel_blocks
+        )
 
-        final_data = modified_data
+        crc_suffix = b""
         success_message = t("message.save_success")
 
         if save_options.perform_crc:
-            with open(original_bundle_path, "rb") as f:
-                original_data = f.read()
-
-            corrected_data = CRCUtils.apply_crc_fix(
-                original_data, 
-                modified_data, 
+            # 只计算需要追加的修正字节，不复制整个 bundle 数据
+            if original_crc is None:
+                original_crc = CRCUtils.get_file_crc32(original_bundle_path)
+            crc_suffix = CRCUtils.compute_crc_fix_suffix(
+                original_crc,
+                CRCUtils.compute_crc32(modified_data),
                 save_options.enable_padding
             )
 
-            if not corrected_data:
+            if not crc_suffix:
                 return False, t("message.crc.correction_failed_file_not_generated", name=output_path.name)
             
-            final_data = corrected_data
             success_message = t("message.save_and_crc_success")
 
         # 写入文件
         with open(output_path, "wb") as f:
-            f.write(final_data)
+            f.write(modified_data)
+            f.write(crc_suffix)
         
         return True, success_message
 
@@ -439,6 +746,270 @@ def _process_spine_group_downgrade(
             log(f'    ✗ {t("log.spine.skel_conversion_failed_using_original")}')
 
 
+# ====== 资源索引相关 ======
+
+# 索引数据库文件，与 config.ini 一样保存在工作目录中
+BUNDLE_INDEX_FILE = "bundle_index.db"
+
+# 索引中记录的资源类型
+INDEXED_ASSET_TYPES = {"Texture2D", "TextAsset", "Mesh", "Material", "Shader", "AnimationClip", "AudioClip"}
+
+def _peek_name(obj: UnityPy.classes.Object) -> str | None:
+    """
+    只读取对象开头的 m_Name 字段，不反序列化整个对象（如贴图的图像数据）。
+    Texture2D、TextAsset 等 NamedObject 的第一个字段就是 m_Name，此时直接从对象原始数据开头读取带长度前缀的字符串，
+    开销与对象大小无关；其他类型使用 UnityPy 的 peek_name，仍不支持时回退到完整读取。
+    """
+    try:
+        node = obj._get_typetree_node()
+        first_field = node.m_Children[0] if node.m_Children else None
+        if first_field is not None and first_field.m_Name == "m_Name" and first_field.m_Type == "string":
+            reader = obj.reader
+            reader.Position = obj.byte_start
+            length = reader.read_int()
+            if 0 <= length <= obj.byte_size - 4:
+                return bytes(reader.read_bytes(length)).decode("utf-8", "surrogateescape")
+    except Exception:
+        pass
+
+    try:
+        return obj.peek_name()
+    except Exception:
+        return getattr(obj.read(), 'm_Name', None)
+
+def _scan_bundle_assets(
+    bundle_path: Path,
+    log: LogFunc = no_log,
+) -> set[tuple[str, str]] | None:
+    """
+    列出 bundle 中所有已命名资源的 (m_Name, 类型)。
+    只根据对象表中的类型进行筛选，并且只读取每个对象的名称字段，不会解码贴图等资源数据。
+    只处理 INDEXED_ASSET_TYPES 中的类型，加载失败时返回 None。
+    """
+    env = load_bundle(bundle_path, log)
+    if not env:
+        return None
+
+    assets: set[tuple[str, str]] = set()
+    for obj in env.objects:
+        if obj.type.name not in INDEXED_ASSET_TYPES:
+            continue
+        try:
+            name = _peek_name(obj)
+        except Exception:
+            continue
+        if name:
+            assets.add((name, obj.type.name))
+    return assets
+
+class BundleIndex:
+    """
+    游戏资源目录的持久化索引，保存在 SQLite 数据库中。
+        bundles 表记录每个 bundle 文件的路径、大小、修改时间和文件名前缀。
+        assets 表记录每个 bundle 中包含的 (m_Name, 类型) 资源，
+            并按 (m_Name, 类型) 建立索引，作为资源到 bundle 的倒排索引使用。
+
+    刷新索引时只比较文件的大小和修改时间，不会加载 bundle。
+    资源列表在文件第一次被查询时扫描，之后只有大小或修改时间变化的文件才会重新扫描。
+    每次操作都使用独立的数据库连接，因此可以在工作线程中使用。
+    数据库文件无法打开或写入时（例如工作目录不可写），改用只在本实例中有效的内存数据库。
+    """
+    SCHEMA_VERSION = 2
+
+    def __init__(self, db_path: Path | str = BUNDLE_INDEX_FILE):
+        self.db_path = Path(db_path)
+        # 本实例中已经刷新过的目录，批量处理时避免重复遍历
+        self._refreshed_dirs: set[str] = set()
+        # 使用内存数据库时的共享连接地址，以及保持数据库存在的连接
+        self._memory_uri: str | None = None
+        self._memory_conn: sqlite3.Connection | None = None
+        try:
+            self._init_db()
+        except sqlite3.Error:
+            self._memory_uri = f"file:bundle_index_{os.getpid()}_{id(self)}?mode=memory&cache=shared"
+            self._memory_conn = sqlite3.connect(self._memory_uri, uri=True, check_same_thread=False)
+            self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._memory_uri is not None:
+            return sqlite3.connect(self._memory_uri, uri=True, timeout=30)
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _init_db(self) -> None:
+        with closing(self._connect()) as conn:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != self.SCHEMA_VERSION:
+                # 结构版本不一致时直接重建，索引内容随时可以重新生成
+                conn.executescript("""
+                    DROP TABLE IF EXISTS assets;
+                    DROP TABLE IF EXISTS bundles;
+                """)
+            conn.executescript(f"""
+                CREATE TABLE IF NOT EXISTS bundles (
+                    path TEXT PRIMARY KEY,
+                    dir TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    prefix TEXT,
+                    scanned INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE INDEX IF NOT EXISTS idx_bundles_dir_name ON bundles (dir, name);
+                CREATE TABLE IF NOT EXISTS assets (
+                    bundle_path TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    type TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_assets_bundle ON assets (bundle_path);
+                CREATE INDEX IF NOT EXISTS idx_assets_name_type ON assets (name, type);
+                PRAGMA user_version = {self.SCHEMA_VERSION};
+            """)
+
+    @staticmethod
+    def _dir_key(path: Path) -> str:
+        return str(path.resolve())
+
+    def refresh(
+        self,
+        search_dirs: list[Path],
+        force: bool = False,
+        log: LogFunc = no_log,
+    ) -> None:
+        """
+        将索引与磁盘上的 bundle 文件同步。
+        新增或大小、修改时间发生变化的文件会被标记为待扫描，已删除的文件会从索引中移除。
+        同一个实例中已刷新过的目录会被跳过，除非指定 force。
+        """
+        with closing(self._connect()) as conn, conn:
+            for search_dir in search_dirs:
+                dir_key = self._dir_key(search_dir)
+                if dir_key in self._refreshed_dirs and not force:
+                    continue
+                self._refreshed_dirs.add(dir_key)
+
+                indexed = {
+                    path: (size, mtime_ns)
+                    for path, size, mtime_ns in conn.execute(
+                        "SELECT path, size, mtime_ns FROM bundles WHERE dir = ?", (dir_key,)
+                    )
+                }
+
+                current: dict[str, tuple[str, int, int]] = {}
+                if os.path.isdir(dir_key):
+                    with os.scandir(dir_key) as entries:
+                        for entry in entries:
+                            if entry.name.endswith(".bundle") and entry.is_file():
+                                stat = entry.stat()
+                                current[entry.path] = (entry.name, stat.st_size, stat.st_mtime_ns)
+
+                removed = [path for path in indexed if path not in current]
+                changed = [
+                    (path, dir_key, name, size, mtime_ns, get_filename_prefix(name)[0])
+                    for path, (name, size, mtime_ns) in current.items()
+                    if indexed.get(path) != (size, mtime_ns)
+                ]
+
+                stale = [(path,) for path in removed] + [(row[0],) for row in changed]
+                conn.executemany("DELETE FROM assets WHERE bundle_path = ?", stale)
+                conn.executemany("DELETE FROM bundles WHERE path = ?", [(path,) for path in removed])
+                conn.executemany(
+                    "INSERT OR REPLACE INTO bundles (path, dir, name, size, mtime_ns, prefix, scanned) VALUES (?, ?, ?, ?, ?, ?, 0)",
+                    changed
+                )
+
+                if changed or removed:
+                    log(f"  > {t('log.search.index_updated', path=dir_key, total=len(current), changed=len(changed), removed=len(removed))}")
+
+    def find_candidates(self, prefix: str, search_dirs: list[Path]) -> list[Path]:
+        """
+        返回索引中位于 search_dirs 内、文件名以 prefix 开头的 bundle 路径。
+        结果按 search_dirs 的顺序排列。
+        """
+        dir_keys = list(dict.fromkeys(self._dir_key(d) for d in search_dirs))
+        candidates: list[Path] = []
+        with closing(self._connect()) as conn:
+            for dir_key in dir_keys:
+                # 用范围查询代替 LIKE，避免文件名中的 '_' 被当作通配符
+                rows = conn.execute(
+                    "SELECT path FROM bundles WHERE dir = ? AND name >= ? AND name < ? ORDER BY name",
+                    (dir_key, prefix, prefix + "\U0010FFFF")
+                )
+                candidates.extend(Path(path) for (path,) in rows)
+        return candidates
+
+    def _ensure_scanned(self, bundle_path: Path, log: LogFunc = no_log) -> str:
+        """
+        确保 bundle 的资源列表已写入索引并与文件保持一致，返回其在索引中的路径键。
+        如果该文件尚未扫描，或扫描后大小、修改时间发生了变化，则重新扫描。
+        """
+        path_key = str(bundle_path.resolve())
+        stat = bundle_path.stat()
+
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT size, mtime_ns, scanned FROM bundles WHERE path = ?", (path_key,)
+            ).fetchone()
+        if row == (stat.st_size, stat.st_mtime_ns, 1):
+            return path_key
+
+        # 扫描时不持有数据库连接，以免长时间锁住索引
+        assets = _scan_bundle_assets(bundle_path, log) or set()
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM assets WHERE bundle_path = ?", (path_key,))
+            conn.execute(
+                "INSERT OR REPLACE INTO bundles (path, dir, name, size, mtime_ns, prefix, scanned) VALUES (?, ?, ?, ?, ?, ?, 1)",
+                (path_key, str(Path(path_key).parent), bundle_path.name, stat.st_size, stat.st_mtime_ns,
+                 get_filename_prefix(bundle_path.name)[0])
+            )
+            conn.executemany(
+                "INSERT INTO assets (bundle_path, name, type) VALUES (?, ?, ?)",
+                [(path_key, name, type_name) for name, type_name in assets]
+            )
+        return path_key
+
+    def get_assets(self, bundle_path: Path, log: LogFunc = no_log) -> set[tuple[str, str]]:
+        """返回 bundle 中包含的 (m_Name, 类型) 集合，必要时先扫描该文件。"""
+        path_key = self._ensure_scanned(bundle_path, log)
+        with closing(self._connect()) as conn:
+            return set(conn.execute(
+                "SELECT name, type FROM assets WHERE bundle_path = ?", (path_key,)
+            ))
+
+    def rank_by_overlap(
+        self,
+        assets: set[tuple[str, str]],
+        bundle_paths: list[Path],
+        log: LogFunc = no_log,
+    ) -> list[tuple[Path, int]]:
+        """
+        通过 (m_Name, 类型) -> bundle 的倒排索引，统计 bundle_paths 中每个文件与 assets 重合的资源数量。
+
+        Returns:
+            按重合数量从高到低排序的 (路径, 重合数量) 列表，数量相同时保持 bundle_paths 中的顺序。
+            不包含重合数量为 0 的文件。
+        """
+        path_keys = {self._ensure_scanned(path, log): path for path in bundle_paths}
+        if not assets or not path_keys:
+            return []
+
+        with closing(self._connect()) as conn:
+            conn.execute("CREATE TEMP TABLE query_assets (name TEXT NOT NULL, type TEXT NOT NULL)")
+            conn.execute("CREATE TEMP TABLE query_bundles (path TEXT PRIMARY KEY)")
+            conn.executemany("INSERT INTO query_assets (name, type) VALUES (?, ?)", assets)
+            conn.executemany("INSERT INTO query_bundles (path) VALUES (?)", [(key,) for key in path_keys])
+            rows = conn.execute("""
+                SELECT a.bundle_path, COUNT(*)
+                FROM query_assets q
+                JOIN assets a ON a.name = q.name AND a.type = q.type
+                JOIN query_bundles b ON b.path = a.bundle_path
+                GROUP BY a.bundle_path
+            """).fetchall()
+
+        order = {key: i for i, key in enumerate(path_keys)}
+        rows.sort(key=lambda row: (-row[1], order[row[0]]))
+        return [(path_keys[key], count) for key, count in rows]
+
 # ====== 寻找对应文件 ======
 
 def get_filename_prefix(filename: str, log: LogFunc = no_log) -> tuple[str | None, str]:
@@ -479,10 +1050,12 @@ def find_new_bundle_path(
     old_mod_path: Path,
     game_resource_dir: Path | list[Path],
     log: LogFunc = no_log,
+    index: BundleIndex | None = None,
 ) -> tuple[Path | None, str]:
     """
     根据旧版Mod文件，在游戏资源目录中智能查找对应的新版文件。
     支持单个目录路径或目录路径列表。
+    候选文件及其包含的资源从 BundleIndex 中查询，未传入 index 时使用默认的索引文件。
     返回 (找到的路径对象, 状态消息) 的元组。
     """
     # TODO: 只用Texture2D比较好像不太对，但是it works
@@ -497,7 +1070,6 @@ def find_new_bundle_path(
     if not prefix:
         return None, prefix_message
     log(f"  > {t('log.search.file_prefix', prefix=prefix)}")
-    extension = '.bundle'
 
     # 2. 处理单个目录或目录列表
     if isinstance(game_resource_dir, Path):
@@ -505,12 +1077,11 @@ def find_new_bundle_path(
     else:
         search_dirs = game_resource_dir
 
-    # 3. 查找所有候选文件（前缀相同且扩展名一致）
-    candidates: list[Path] = []
-    for search_dir in search_dirs:
-        if search_dir.exists() and search_dir.is_dir():
-            dir_candidates = [f for f in search_dir.iterdir() if f.is_file() and f.name.startswith(prefix) and f.suffix == extension]
-            candidates.extend(dir_candidates)
+    # 3. 从索引中查找所有候选文件（前缀相同的 bundle 文件）
+    if index is None:
+        index = BundleIndex()
+    index.refresh(search_dirs, log=log)
+    candidates = index.find_candidates(prefix, search_dirs)
     
     if not candidates:
         msg = t("message.search.no_matching_files_in_dir")
@@ -525,7 +1096,10 @@ def find_new_bundle_path(
         log(f'  > {t("common.fail")}: {msg}')
         return None, msg
     
-    old_textures_map = {obj.read().m_Name for obj in old_env.objects if obj.type == AssetType.Texture2D}
+    old_textures_map = {
+        name for obj in old_env.objects
+        if obj.type == AssetType.Texture2D and (name := _peek_name(obj))
+    }
     
     if not old_textures_map:
         msg = t("message.search.no_texture2d_in_old_mod")
@@ -533,88 +1107,788 @@ def find_new_bundle_path(
         return None, msg
     log(f"  > {t('log.search.old_mod_texture_count', count=len(old_textures_map))}")
 
-    # 5. 遍历候选文件，找到第一个包含匹配贴图的
-    for candidate_path in candidates:
-        log(f"  - {t('log.search.checking_candidate', name=candidate_path.name)}")
-        
-        env = load_bundle(candidate_path, log)
-        if not env: continue
-        
-        for obj in env.objects:
-            if obj.type == AssetType.Texture2D and obj.read().m_Name in old_textures_map:
-                msg = t("message.search.new_file_confirmed", name=candidate_path.name)
-                log(f"  ✅ {msg}")
-                return candidate_path, msg
+    # 5. 通过倒排索引统计每个候选文件包含的匹配贴图数量，选择重合最多的
+    ranked = index.rank_by_overlap(
+        {(name, "Texture2D") for name in old_textures_map}, candidates, log
+    )
+    for candidate_path, count in ranked:
+        log(f"  - {t('log.search.candidate_overlap', name=candidate_path.name, count=count)}")
+
+    if ranked:
+        best_path = ranked[0][0]
+        msg = t("message.search.new_file_confirmed", name=best_path.name)
+        log(f"  ✅ {msg}")
+        return best_path, msg
     
     msg = t("message.search.no_matching_texture_found")
     log(f'  > {t("common.fail")}: {msg}')
     return None, msg
 
+# ====== 贴图文件格式 ======
+
+# 各贴图输出格式对应的文件后缀
+TEXTURE_FILE_SUFFIXES: dict[str, str] = {
+    "png": ".png",
+    "rgba": ".rgba",
+    "qoi": ".qoi",
+    "tga": ".tga",
+    "raw": ".tex",
+}
+
+# 打包时同名贴图文件的优先级，靠前的优先：原始贴图数据无需重新编码，其次是无损格式，最后是 PNG
+TEXTURE_FILE_PRIORITY: tuple[str, ...] = (".tex", ".rgba", ".qoi", ".tga", ".png")
+
+# .rgba 文件头：魔数、宽度、高度，之后是从上到下逐行排列的 RGBA 像素
+RGBA_FILE_MAGIC = b"RGBA"
+RGBA_FILE_HEADER = struct.Struct("<4sII")
+
+# .tex 文件头：魔数、宽度、高度、贴图格式、mipmap 数量、平台、Unity 版本（4 个整数）、平台数据长度，
+# 之后依次是平台数据和贴图的编码数据
+RAW_TEXTURE_MAGIC = b"UTEX"
+RAW_TEXTURE_HEADER = struct.Struct("<4s9iI")
+
+@dataclass
+class EncodedTexture:
+    """贴图原始的编码数据以及解码所需的参数，对应提取时输出的 .tex 文件。"""
+    width: int
+    height: int
+    texture_format: int
+    mip_count: int
+    platform: int
+    version: tuple[int, int, int, int]
+    platform_blob: bytes
+    image_data: bytes
+
+    @classmethod
+    def from_texture(cls, obj: UnityPy.classes.Object) -> "EncodedTexture":
+        """从 Texture2D 对象读取编码数据，数据保存在外部资源 (.resS) 中时会一并读取。"""
+        data = obj.read()
+        return cls(
+            width=data.m_Width,
+            height=data.m_Height,
+            texture_format=int(data.m_TextureFormat),
+            mip_count=data.m_MipCount or 1,
+            platform=int(obj.platform),
+            version=tuple(obj.version),
+            platform_blob=bytes(data.m_PlatformBlob or b""),
+            image_data=bytes(data.get_image_data()),
+        )
+
+    @classmethod
+    def read(cls, file_path: Path) -> "EncodedTexture":
+        payload = file_path.read_bytes()
+        if len(payload) < RAW_TEXTURE_HEADER.size or payload[:4] != RAW_TEXTURE_MAGIC:
+            raise ValueError(t("message.texture_file.invalid_header", name=file_path.name))
+        _, width, height, texture_format, mip_count, platform, *version, blob_size = RAW_TEXTURE_HEADER.unpack_from(payload)
+        blob_end = RAW_TEXTURE_HEADER.size + blob_size
+        return cls(
+            width=width,
+            height=height,
+            texture_format=texture_format,
+            mip_count=mip_count,
+            platform=platform,
+            version=tuple(version),
+            platform_blob=payload[RAW_TEXTURE_HEADER.size:blob_end],
+            image_data=payload[blob_end:],
+        )
+
+    def write(self, file_path: Path) -> None:
+        with open(file_path, "wb") as f:
+            f.write(RAW_TEXTURE_HEADER.pack(
+                RAW_TEXTURE_MAGIC, self.width, self.height, self.texture_format, self.mip_count,
+                self.platform, *self.version, len(self.platform_blob),
+            ))
+            f.write(self.platform_blob)
+            f.write(self.image_data)
+
+    def to_image(self) -> Image.Image:
+        """解码为 RGBA 图像，与 Texture2D.image 使用相同的解码函数。"""
+        from UnityPy.export import Texture2DConverter
+
+        image = Texture2DConverter.parse_image_data(
+            self.image_data, self.width, self.height, self.texture_format,
+            self.version, self.platform, list(self.platform_blob),
+        )
+        return image.convert("RGBA")
+
+def _save_texture_file(
+    image: Image.Image,
+    file_path: Path,
+    file_format: TextureFileFormat,
+    compress_level: int = 6,
+    optimize: bool = False,
+) -> None:
+    """将 RGBA 图像保存为指定格式的贴图文件，compress_level 和 optimize 只对 PNG 有效。"""
+    if file_format == "png":
+        image.save(file_path, format="PNG", compress_level=compress_level, optimize=optimize)
+    elif file_format == "rgba":
+        with open(file_path, "wb") as f:
+            f.write(RGBA_FILE_HEADER.pack(RGBA_FILE_MAGIC, image.width, image.height))
+            f.write(image.tobytes())
+    elif file_format == "qoi":
+        image.save(file_path, format="QOI")
+    elif file_format == "tga":
+        # Pillow 默认不对 TGA 进行 RLE 压缩
+        image.save(file_path, format="TGA")
+    else:
+        raise ValueError(t("message.texture_file.unsupported_format", format=file_format))
+
+def _load_rgba_image(file_path: Path) -> Image.Image:
+    """读取图片文件（PNG、QOI、TGA 或 .rgba）并转换为 RGBA，读取完成后立即关闭文件。"""
+    if file_path.suffix.lower() == TEXTURE_FILE_SUFFIXES["rgba"]:
+        payload = file_path.read_bytes()
+        if len(payload) < RGBA_FILE_HEADER.size or payload[:4] != RGBA_FILE_MAGIC:
+            raise ValueError(t("message.texture_file.invalid_header", name=file_path.name))
+        _, width, height = RGBA_FILE_HEADER.unpack_from(payload)
+        return Image.frombytes("RGBA", (width, height), payload[RGBA_FILE_HEADER.size:])
+
+    with Image.open(file_path) as image:
+        return image.convert("RGBA")
+
+# ====== 贴图编码缓存 ======
+
+# 缓存目录，与 config.ini 一样位于工作目录中
+TEXTURE_CACHE_DIR = "texture_cache"
+# 缓存目录的大小上限（字节），超出后删除最久未使用的条目
+TEXTURE_CACHE_MAX_SIZE = 2 * 1024 ** 3
+
+class TextureCache:
+    """
+    已编码贴图数据的磁盘缓存，按内容寻址。
+    键由图像的像素数据哈希、目标贴图格式、尺寸、mipmap 数量、平台和 UnityPy 版本共同决定，
+    值是编码后的贴图数据和实际使用的贴图格式。
+    同一张图片再次打包到相同格式的贴图时直接使用缓存，不需要重新编码。
+    每个条目保存为单独的文件，写入时先写临时文件再替换，因此可以被多个进程同时使用。
+    读取条目时会更新其修改时间，缓存总大小超过 max_size 时按修改时间删除最久未使用的条目。
+    """
+    def __init__(self, cache_dir: Path | str = TEXTURE_CACHE_DIR, max_size: int = TEXTURE_CACHE_MAX_SIZE):
+        self.cache_dir = Path(cache_dir)
+        self.max_size = max_size
+        # 估计的缓存总大小，第一次写入时扫描缓存目录得到
+        self._total_size: int | None = None
+
+    @staticmethod
+    def make_key(
+        image: Image.Image,
+        texture_format: int,
+        mip_count: int,
+        platform: int,
+        platform_blob: Any = None,
+    ) -> str:
+        hasher = hashlib.sha256()
+        hasher.update(f"{UnityPy.__version__}|{image.mode}|{image.width}x{image.height}|{int(texture_format)}|{mip_count}|{int(platform)}|".encode())
+        if platform_blob:
+            hasher.update(bytes(platform_blob))
+        hasher.update(b"|")
+        hasher.update(image.tobytes())
+        return hasher.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.bin"
+
+    def contains(self, key: str) -> bool:
+        return self._entry_path(key).is_file()
+
+    def get(self, key: str) -> tuple[bytes, int] | None:
+        """返回 (编码后的数据, 贴图格式)，未命中时返回 None。"""
+        path = self._entry_path(key)
+        try:
+            payload = path.read_bytes()
+        except OSError:
+            return None
+        if len(payload) < 4:
+            return None
+        try:
+            # 更新修改时间，标记为最近使用
+            os.utime(path)
+        except OSError:
+            pass
+        return payload[4:], struct.unpack("<i", payload[:4])[0]
+
+    def put(self, key: str, image_data: bytes, texture_format: int) -> None:
+        path = self._entry_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(struct.pack("<i", int(texture_format)))
+                f.write(image_data)
+            os.replace(temp_path, path)
+        except OSError:
+            return
+
+        if self._total_size is None:
+            self._total_size = sum(size for _, _, size in self._scan_entries())
+        else:
+            self._total_size += len(image_data) + 4
+        if self._total_size > self.max_size:
+            self.trim()
+
+    def _scan_entries(self) -> list[tuple[float, Path, int]]:
+        """返回所有缓存条目的 (修改时间, 路径, 大小)。"""
+        entries = []
+        for path in self.cache_dir.glob("*/*.bin"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path, stat.st_size))
+        return entries
+
+    def trim(self, target_size: int | None = None) -> None:
+        """
+        删除最久未使用的条目，直到缓存总大小不超过 target_size（默认为 max_size 的 80%，避免频繁清理）。
+        """
+        if target_size is None:
+            target_size = self.max_size * 4 // 5
+        entries = sorted(self._scan_entries())
+        total_size = sum(size for _, _, size in entries)
+        for _, path, size in entries:
+            if total_size <= target_size:
+                break
+            try:
+                path.unlink()
+                total_size -= size
+            except OSError:
+                pass
+        self._total_size = total_size
+
+_texture_cache: TextureCache | None = None
+
+def _get_texture_cache() -> TextureCache:
+    global _texture_cache
+    if _texture_cache is None:
+        _texture_cache = TextureCache()
+    return _texture_cache
+
+def _set_texture_image(
+    data: Any,
+    image: Image.Image,
+    encoded: tuple[bytes, int] | None = None,
+    use_cache: bool = True,
+) -> None:
+    """
+    将图像编码到贴图对象中，等同于 data.image = image，但会优先使用已编码贴图缓存。
+    提供 encoded (编码后的数据, 贴图格式) 时直接使用，不再查询缓存或编码。
+    use_cache 为 False 时不读写缓存，直接编码。
+    与 UnityPy 一样只写入一层 mipmap，编码结果保存在对象内部。
+    """
+    if encoded is None and not use_cache:
+        data.image = image
+        return
+
+    if encoded is None:
+        cache = _get_texture_cache()
+        key = cache.make_key(image, data.m_TextureFormat, 1, data.object_reader.platform, data.m_PlatformBlob)
+
+        encoded = cache.get(key)
+        if encoded is None:
+            data.image = image
+            cache.put(key, bytes(data.image_data), data.m_TextureFormat)
+            return
+
+    image_data, texture_format = encoded
+    data.m_Width = image.width
+    data.m_Height = image.height
+    if data.m_MipMap is not None:
+        data.m_MipMap = False
+    if data.m_MipCount is not None:
+        data.m_MipCount = 1
+    data.image_data = image_data
+    data.m_CompleteImageSize = len(image_data)
+    data.m_TextureFormat = texture_format
+    if data.m_StreamData is not None:
+        data.m_StreamData.path = ""
+        data.m_StreamData.offset = 0
+        data.m_StreamData.size = 0
+
+# ====== 增量提取清单 ======
+
+# 清单文件名，保存在提取的输出目录中
+EXTRACT_MANIFEST_FILE = ".extract_manifest.json"
+
+class ExtractionManifest:
+    """
+    增量提取使用的清单，记录输出目录中每个文件对应资源的原始数据哈希。
+    哈希由对象的原始字节计算，不需要解码对象。
+    图像数据保存在外部资源 (.resS) 中的 Texture2D，原始字节只包含数据的路径、偏移和大小，
+    因此还会读取并计算外部图像数据的哈希，这仍然比解码贴图快得多。
+    再次提取时，哈希未变化且输出文件仍然存在的资源会被跳过。
+    """
+    def __init__(self, output_dir: Path):
+        self.path = output_dir / EXTRACT_MANIFEST_FILE
+        self.entries: dict[str, str] = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            if isinstance(entries, dict):
+                self.entries = entries
+        except (OSError, ValueError):
+            pass
+
+    @staticmethod
+    def hash_object(obj: UnityPy.classes.Object) -> str:
+        hasher = hashlib.sha256()
+        hasher.update(f"{obj.type.name}|".encode())
+        hasher.update(obj.get_raw_data())
+        if obj.type == AssetType.Texture2D:
+            data = obj.read()
+            stream_data = data.m_StreamData
+            if stream_data is not None and stream_data.size > 0:
+                hasher.update(b"|")
+                hasher.update(bytes(data.get_image_data()))
+        return hasher.hexdigest()
+
+    def is_unchanged(self, file_name: str, asset_hash: str) -> bool:
+        return self.entries.get(file_name) == asset_hash and (self.path.parent / file_name).exists()
+
+    def record(self, file_name: str, asset_hash: str) -> None:
+        self.entries[file_name] = asset_hash
+
+    def save(self) -> None:
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f, ensure_ascii=False, indent=1, sort_keys=True)
+            os.replace(temp_path, self.path)
+        except OSError:
+            pass
+
+def _count_extracted_files(output_dir: Path) -> int:
+    """统计提取输出目录中的文件数量，不包括增量提取清单。"""
+    if not output_dir.is_dir():
+        return 0
+    return len([item for item in output_dir.iterdir() if item.name != EXTRACT_MANIFEST_FILE])
+
+# ====== 多进程任务 ======
+
+def _init_pool_worker(language: str, setup: Callable[[], None] | None) -> None:
+    """进程池工作进程的初始化函数，同步界面语言并执行调用方提供的初始化函数。"""
+    i18n_manager.set_language(language)
+    if setup:
+        setup()
+
+def _call_logged(func: Callable[..., Any], task: tuple, log: LogFunc) -> tuple[Any, str | None]:
+    """
+    调用 func(*task, log=log)，返回 (结果, 错误信息) 的元组。
+    func 抛出异常时记录错误和调用栈，结果为 None。
+    """
+    try:
+        return func(*task, log=log), None
+    except Exception as e:
+        log(f"❌ {t('common.error')}: {t('log.error_processing', error=e)}")
+        log(traceback.format_exc())
+        return None, str(e)
+
+def _call_in_worker(func: Callable[..., Any], task: tuple) -> tuple[Any, str | None, list[str]]:
+    """在工作进程中调用 func，日志不直接输出，而是收集起来随结果一起返回。"""
+    logs: list[str] = []
+    result, error = _call_logged(func, task, logs.append)
+    return result, error, logs
+
+def _run_tasks_in_order(
+    tasks: list[tuple],
+    func: Callable[..., Any],
+    log: LogFunc,
+    on_start: Callable[[int], None],
+    on_finish: Callable[[int, Any, str | None], None],
+    max_workers: int = 1,
+    worker_func: Callable[..., Any] | None = None,
+    worker_setup: Callable[[], None] | None = None,
+) -> None:
+    """
+    依次执行每个任务 func(*task, log=log)。
+    max_workers 大于1时各任务在独立的进程中执行，日志在任务完成后按提交顺序输出，与串行处理时的顺序一致。
+
+    Args:
+        tasks: 每个任务的参数元组。
+        func: 在主进程中串行执行时调用的函数。
+        log: 日志记录函数。
+        on_start: 开始输出某个任务的日志之前调用，接收任务索引。
+        on_finish: 任务完成后调用，接收 (任务索引, 结果, 错误信息)；任务抛出异常时结果为 None。
+        max_workers: 并行处理的进程数。
+        worker_func: 在工作进程中调用的函数，默认为 func，必须可以被 pickle。
+        worker_setup: 工作进程启动时执行的初始化函数，必须可以被 pickle。
+    """
+    if max_workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(tasks)),
+            initializer=_init_pool_worker,
+            initargs=(i18n_manager.lang, worker_setup),
+        ) as executor:
+            futures = [executor.submit(_call_in_worker, worker_func or func, task) for task in tasks]
+
+            # 按提交顺序等待结果，保证日志顺序与串行处理一致
+            for i, future in enumerate(futures):
+                try:
+                    result, error, task_logs = future.result()
+                except Exception as e:  # 工作进程异常退出等
+                    result, error = None, str(e)
+                    task_logs = [f"❌ {t('common.error')}: {t('log.error_processing', error=e)}"]
+                on_start(i)
+                for message in task_logs:
+                    log(message)
+                on_finish(i, result, error)
+    else:
+        for i, task in enumerate(tasks):
+            on_start(i)
+            result, error = _call_logged(func, task, log)
+            on_finish(i, result, error)
+
 # ====== 资源处理相关 ======
 
+# 以原始数据整体替换的资源类型
+RAW_REPLACE_ASSET_TYPES = {AssetType.Mesh, AssetType.Material, AssetType.Shader, AssetType.AnimationClip}
+
+def _get_replacement_types(replacement_map: dict[AssetKey, AssetContent]) -> set[str] | None:
+    """
+    推断替换清单可能替换到的资源类型名称集合。
+    (名称, 类型) 键直接给出类型；其他键根据内容推断，图像只能替换 Texture2D，字节数据可以替换 TextAsset 或按原始数据替换的类型。
+    "ALL" 模式下任何类型都可能被替换，返回 None。
+    """
+    if "ALL" in replacement_map.get("__mode__", set()):
+        return None
+
+    types: set[str] = set()
+    for key, content in replacement_map.items():
+        if isinstance(key, tuple):
+            types.add(key[1])
+        elif isinstance(content, LazyAssetContent):
+            types.add(content.asset_type)
+        elif isinstance(content, Image.Image):
+            types.add(AssetType.Texture2D.name)
+        elif isinstance(content, bytes):
+            types.add(AssetType.TextAsset.name)
+            types.update(asset_type.name for asset_type in RAW_REPLACE_ASSET_TYPES)
+    return types
+
 def _apply_replacements(
     env: UnityPy.Environment,
     replacement_map: dict[AssetKey, AssetContent],
     key_func: KeyGeneratorFunc,
     log: LogFunc = no_log,
+    encode_workers: int = 1,
+    use_texture_cache: bool = True,
 ) -> tuple[int, list[str], set[AssetKey]]:
     """
     将“替换清单”中的资源应用到目标环境中。
 
+    清单中不可能出现的类型只根据 obj.type 跳过，只有键匹配成功的对象才会被完整读取。
+    先找出所有匹配的对象，再统一写入，需要重新编码的贴图可以并行编码。
+
     Args:
         env: 目标 UnityPy 环境。
         replacement_map: 资源替换清单，格式为 { asset_key: content }。
         key_func: 用于从目标环境中的对象生成 asset_key 的函数。
         log: 日志记录函数。
+        encode_workers: 编码贴图时使用的进程数。
+        use_texture_cache: 是否使用已编码贴图缓存。
 
     Returns:
         一个元组 (成功替换的数量, 成功替换的资源日志列表, 未能匹配的资源键集合)。
     """
-    replacement_count = 0
-    replaced_assets_log = []
-    
     # 创建一个副本用于操作，因为我们会从中移除已处理的项
     tasks = replacement_map.copy()
+    matched: list[tuple[UnityPy.classes.Object, AssetContent]] = []
+
+    # 清单可能替换到的类型，为 None 时不做筛选
+    target_types = _get_replacement_types(replacement_map)
+    # "ALL" 模式下，其他类型的资源也按原始数据替换
+    replace_all = "ALL" in replacement_map.get("__mode__", set())
 
     for obj in env.objects:
         if not tasks:  # 如果清单空了，就提前退出
             break
+
+        if target_types is not None and obj.type.name not in target_types:
+            continue
         
         try:
-            data = obj.read()
-            asset_key = key_func(obj, data)
-
+            asset_key = key_func(obj)
             if asset_key in tasks:
-                content = tasks.pop(asset_key)
-                resource_name = getattr(data, 'm_Name', t("log.unnamed_resource", type=obj.type.name))
-                
-                if obj.type == AssetType.Texture2D:
-                    data.image = content
-                    data.save()
-                elif obj.type == AssetType.TextAsset:
-                    # content 是 bytes，需要解码成 str
-                    data.m_Script = content.decode("utf-8", "surrogateescape")
-                    data.save()
-                elif obj.type in {AssetType.Mesh, AssetType.Material, AssetType.Shader, AssetType.AnimationClip}:
-                    obj.set_raw_data(content)
-                elif "ALL" in replacement_map.get("__mode__", set()): 
-                # Check for a special key if we're in "ALL" mode
-                    obj.set_raw_data(content)
-
-                replacement_count += 1
-                log_message = f"[{obj.type.name}] {resource_name}"
-                replaced_assets_log.append(log_message)
-
+                matched.append((obj, tasks.pop(asset_key)))
         except Exception as e:
-            resource_name_for_error = "N/A"
-            try:
-                resource_name_for_error = obj.read().m_Name
-            except Exception:
-                pass
-            log(f'  ❌ {t("common.error")}: {t("log.replace_resource_failed", name=resource_name_for_error, type=obj.type.name, error=e)}')
+            _log_replace_failure(obj, e, log)
 
+    replacement_count, replaced_assets_log = _apply_matches(matched, replace_all, encode_workers, log, use_texture_cache)
     return replacement_count, replaced_assets_log, set(tasks.keys())
 
+def _apply_replacements_by_priority(
+    env: UnityPy.Environment,
+    strategies: list[tuple[str, KeyGeneratorFunc, dict[AssetKey, AssetContent]]],
+    log: LogFunc = no_log,
+    encode_workers: int = 1,
+    use_texture_cache: bool = True,
+) -> tuple[str | None, int, list[str]]:
+    """
+    按优先级使用多个匹配策略，将替换清单应用到目标环境中。
+    只遍历目标环境一次，同时计算每个对象在所有策略下的匹配结果，
+    然后应用优先级最高、且成功替换了至少一个资源的策略。
+    结果与依次对每个策略调用 _apply_replacements 直到成功相同。
+
+    Args:
+        env: 目标 UnityPy 环境。
+        strategies: 按优先级排列的 (策略名称, key 生成函数, 替换清单) 列表。
+        log: 日志记录函数。
+        encode_workers: 编码贴图时使用的进程数。
+        use_texture_cache: 是否使用已编码贴图缓存。
+
+    Returns:
+        一个元组 (成功的策略名称, 成功替换的数量, 成功替换的资源日志列表)，没有策略成功时策略名称为 None。
+    """
+    # 每个策略都有自己的待处理清单副本和可能替换到的类型
+    tasks_list = [replacement_map.copy() for _, _, replacement_map in strategies]
+    types_list = [_get_replacement_types(replacement_map) for _, _, replacement_map in strategies]
+    target_types: set[str] | None = set()
+    for types in types_list:
+        if types is None:
+            target_types = None
+            break
+        target_types |= types
+
+    # 每个策略匹配到的 (对象, 内容)，匹配阶段不修改对象
+    matches: list[list[tuple[UnityPy.classes.Object, AssetContent]]] = [[] for _ in strategies]
+
+    for obj in env.objects:
+        if not any(tasks_list):  # 如果所有清单都空了，就提前退出
+            break
+
+        if target_types is not None and obj.type.name not in target_types:
+            continue
+
+        for (_, key_func, _), tasks, types, matched in zip(strategies, tasks_list, types_list, matches):
+            if not tasks or (types is not None and obj.type.name not in types):
+                continue
+            try:
+                asset_key = key_func(obj)
+                if asset_key in tasks:
+                    matched.append((obj, tasks.pop(asset_key)))
+            except Exception as e:
+                _log_replace_failure(obj, e, log)
+
+    for (name, _, replacement_map), matched in zip(strategies, matches):
+        replace_all = "ALL" in replacement_map.get("__mode__", set())
+        replacement_count, replaced_assets_log = _apply_matches(matched, replace_all, encode_workers, log, use_texture_cache)
+
+        if replacement_count > 0:
+            return name, replacement_count, replaced_assets_log
+
+        log(f'  > {t("log.b2b.strategy_no_match", name=name)}')
+
+    return None, 0, []
+
+def _apply_matches(
+    matched: list[tuple[UnityPy.classes.Object, AssetContent]],
+    replace_all: bool,
+    encode_workers: int = 1,
+    log: LogFunc = no_log,
+    use_texture_cache: bool = True,
+) -> tuple[int, list[str]]:
+    """
+    将匹配结果依次写入目标对象，返回 (成功替换的数量, 成功替换的资源日志列表)。
+    encode_workers 大于1时，先在进程池中并行编码所有需要重新编码的贴图，再依次写入 env。
+    """
+    encoded = _encode_textures_parallel(matched, encode_workers, log, use_texture_cache) if encode_workers > 1 else {}
+
+    replacement_count = 0
+    replaced_assets_log = []
+    for obj, content in matched:
+        try:
+            replaced_assets_log.append(_replace_object(obj, content, replace_all, encoded.get(id(obj)), use_texture_cache))
+            replacement_count += 1
+        except Exception as e:
+            _log_replace_failure(obj, e, log)
+
+    return replacement_count, replaced_assets_log
+
+def _encode_texture_job(
+    image: Image.Image,
+    texture_format: int,
+    platform: int,
+    platform_blob: Any,
+) -> tuple[bytes, int]:
+    """
+    在子进程中执行的贴图编码任务，与 Texture2D.image 的 setter 使用相同的编码函数。
+    """
+    from UnityPy.export import Texture2DConverter
+
+    image_data, texture_format = Texture2DConverter.image_to_texture2d(image, texture_format, platform, platform_blob)
+    return bytes(image_data), int(texture_format)
+
+def _encode_textures_parallel(
+    matched: list[tuple[UnityPy.classes.Object, AssetContent]],
+    workers: int,
+    log: LogFunc = no_log,
+    use_cache: bool = True,
+) -> dict[int, tuple[bytes, int]]:
+    """
+    在进程池中并行编码所有需要重新编码的贴图替换。
+    可以直接复制编码数据的贴图、已在贴图编码缓存中的贴图会被跳过，编码结果会写入缓存。
+    use_cache 为 False 时不读写缓存，缓存键只用于合并相同的编码任务。
+    返回 { id(目标对象): (编码后的数据, 贴图格式) }；准备或编码失败的贴图不在结果中，写入时会按原流程重新编码。
+    """
+    cache = _get_texture_cache() if use_cache else None
+    # 相同的图像和编码参数只编码一次
+    jobs: dict[str, tuple[Image.Image, int, int, Any]] = {}
+    job_targets: dict[str, list[int]] = {}
+
+    for obj, content in matched:
+        if obj.type != AssetType.Texture2D:
+            continue
+        try:
+            data = obj.read()
+            if isinstance(content, LazyAssetContent):
+                if content.source is not None and _texture_params_match(data, content.source):
+                    continue
+                content = content.load()
+            platform = data.object_reader.platform
+            key = TextureCache.make_key(content, data.m_TextureFormat, 1, platform, data.m_PlatformBlob)
+            if cache is not None and key not in jobs and cache.contains(key):
+                continue
+            jobs.setdefault(key, (content, data.m_TextureFormat, platform, data.m_PlatformBlob))
+            job_targets.setdefault(key, []).append(id(obj))
+        except Exception:
+            continue
+
+    # 只有一张贴图需要编码时，不值得启动进程池
+    if len(jobs) < 2:
+        return {}
+
+    workers = min(workers, len(jobs))
+    log(f"  > {t('log.texture.encoding_parallel', count=len(jobs), workers=workers)}")
+
+    encoded: dict[int, tuple[bytes, int]] = {}
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {key: executor.submit(_encode_texture_job, *job) for key, job in jobs.items()}
+            for key, future in futures.items():
+                try:
+                    image_data, texture_format = future.result()
+                except Exception:
+                    continue
+                if cache is not None:
+                    cache.put(key, image_data, texture_format)
+                for target_id in job_targets[key]:
+                    encoded[target_id] = (image_data, texture_format)
+    except Exception as e:
+        log(f"  > ⚠️ {t('log.texture.encoding_parallel_failed', error=e)}")
+
+    return encoded
+
+def _replace_object(
+    obj: UnityPy.classes.Object,
+    content: AssetContent,
+    replace_all: bool,
+    encoded: tuple[bytes, int] | None = None,
+    use_texture_cache: bool = True,
+) -> str:
+    """
+    将 content 写入目标对象，返回用于日志的资源描述。
+    延迟加载的内容在此时才被加载。
+    encoded 是预先编码好的贴图数据 (编码后的数据, 贴图格式)，提供时不再编码贴图。
+    use_texture_cache 为 False 时编码贴图不读写已编码贴图缓存。
+    """
+    data = obj.read()
+    resource_name = getattr(data, 'm_Name', t("log.unnamed_resource", type=obj.type.name))
+
+    # 源贴图与目标贴图的编码参数一致时，直接复制已编码的数据，不需要解码源贴图
+    if (
+        obj.type == AssetType.Texture2D
+        and isinstance(content, LazyAssetContent)
+        and content.source is not None
+        and _copy_encoded_texture(data, content.source)
+    ):
+        data.save()
+        return f"[{obj.type.name}] {resource_name}"
+
+    if isinstance(content, LazyAssetContent):
+        content = content.load()
+    
+    if obj.type == AssetType.Texture2D:
+        _set_texture_image(data, content, encoded, use_texture_cache)
+        data.save()
+    elif obj.type == AssetType.TextAsset:
+        # content 是 bytes，需要解码成 str
+        data.m_Script = content.decode("utf-8", "surrogateescape")
+        data.save()
+    elif obj.type in RAW_REPLACE_ASSET_TYPES:
+        obj.set_raw_data(content)
+    elif replace_all:
+        obj.set_raw_data(content)
+
+    return f"[{obj.type.name}] {resource_name}"
+
+def _copy_encoded_texture(
+    target: Any,
+    source: UnityPy.classes.Object | EncodedTexture,
+) -> bool:
+    """
+    如果源贴图与目标贴图的格式、尺寸、mipmap 数量和平台都相同，将源贴图已编码的图像数据（包括 mipmap）
+    直接复制到目标贴图中，跳过解码和重新编码。
+    对于 ASTC、ETC2、BC7 等压缩格式，这样既避免了耗时的编码，也避免了有损的往返转换。
+    源贴图可以是 UnityPy 对象，也可以是从原始贴图文件 (.tex) 读取的 EncodedTexture。
+    源贴图数据保存在外部资源 (.resS) 中时会一并读取，写入后目标贴图的数据保存在对象内部。
+    返回是否已复制；参数不一致或读取失败时返回 False，由调用方走解码和编码的流程。
+    """
+    try:
+        if not _texture_params_match(target, source):
+            return False
+
+        if isinstance(source, EncodedTexture):
+            image_data = source.image_data
+            complete_image_size = len(image_data)
+        else:
+            source_data = source.read()
+            image_data = bytes(source_data.get_image_data())
+            complete_image_size = source_data.m_CompleteImageSize
+    except Exception:
+        return False
+
+    target.image_data = image_data
+    target.m_CompleteImageSize = complete_image_size
+    if target.m_StreamData is not None:
+        target.m_StreamData.path = ""
+        target.m_StreamData.offset = 0
+        target.m_StreamData.size = 0
+    return True
+
+def _texture_params_match(
+    target: Any,
+    source: UnityPy.classes.Object | EncodedTexture,
+) -> bool:
+    """
+    判断源贴图与目标贴图的格式、尺寸、mipmap 数量和平台是否都相同，即能否直接复制已编码的数据。
+    """
+    try:
+        if isinstance(source, EncodedTexture):
+            if source.platform != target.object_reader.platform:
+                return False
+            source_params = (source.texture_format, source.width, source.height, source.mip_count)
+            target_params = (target.m_TextureFormat, target.m_Width, target.m_Height, target.m_MipCount or 1)
+            return source_params == target_params
+
+        if source.type != AssetType.Texture2D or source.platform != target.object_reader.platform:
+            return False
+
+        source_data = source.read()
+        source_params = (source_data.m_TextureFormat, source_data.m_Width, source_data.m_Height, source_data.m_MipCount)
+        target_params = (target.m_TextureFormat, target.m_Width, target.m_Height, target.m_MipCount)
+        return source_params == target_params
+    except Exception:
+        return False
+
+def _log_replace_failure(
+    obj: UnityPy.classes.Object,
+    error: Exception,
+    log: LogFunc = no_log,
+) -> None:
+    resource_name_for_error = "N/A"
+    try:
+        resource_name_for_error = obj.read().m_Name
+    except Exception:
+        pass
+    log(f'  ❌ {t("common.error")}: {t("log.replace_resource_failed", name=resource_name_for_error, type=obj.type.name, error=error)}')
+
 def process_asset_packing(
     target_bundle_path: Path,
     asset_folder: Path,
@@ -622,12 +1896,15 @@ def process_asset_packing(
     save_options: SaveOptions,
     spine_options: SpineOptions | None = None,
     log: LogFunc = no_log,
+    lazy_images: bool = False,
 ) -> tuple[bool, str]:
     """
     从指定文件夹中，将同名的资源打包到指定的 Bundle 中。
-    支持 .png, .skel, .atlas 文件。
-    - .png 文件将替换同名的 Texture2D 资源 (文件名不含后缀)。
+    支持 .png, .qoi, .tga, .rgba, .tex, .skel, .atlas 文件。
+    - 图片文件 (.png, .qoi, .tga, .rgba) 和原始贴图文件 (.tex) 将替换同名的 Texture2D 资源 (文件名不含后缀)。
+    - .tex 文件的贴图格式、尺寸和 mipmap 数量与目标贴图相同时直接写入编码数据，不需要解码和重新编码。
     - .skel 和 .atlas 文件将替换同名的 TextAsset 资源 (文件名含后缀)。
+    只有在目标 Bundle 中存在同名资源的文件才会被读取和解码，其余文件只会在结果中报告为未匹配。
     可选地升级 Spine 动画的 Skel 资源版本。
     此函数将生成的文件保存在工作目录中，以便后续进行"覆盖原文件"操作。
     因为打包资源的操作在原理上是替换目标Bundle内的资源，因此里面可能有混用打包和替换的叫法。
@@ -640,30 +1917,94 @@ def process_asset_packing(
         save_options: 保存和CRC修正的选项
         spine_options: Spine资源升级的选项
         log: 日志记录函数，默认为空函数
+        lazy_images: 为 True 时图片只在匹配到目标贴图后才解码；否则使用线程池并行解码所有图片
     """
     try:
-        env = load_bundle(target_bundle_path, log)
+        env, target_crc = load_bundle_with_crc(target_bundle_path, log, save_options.perform_crc)
         if not env:
             return False, t("message.packer.load_target_bundle_failed")
         
         # 1. 从文件夹构建"替换清单"
         replacement_map: dict[AssetKey, AssetContent] = {}
-        supported_extensions = {".png", ".skel", ".atlas"}
-        input_files = [f for f in asset_folder.iterdir() if f.is_file() and f.suffix.lower() in supported_extensions]
+        texture_suffixes = set(TEXTURE_FILE_SUFFIXES.values())
+        supported_extensions = texture_suffixes | {".skel", ".atlas"}
+        input_files = sorted(
+            f for f in asset_folder.iterdir() if f.is_file() and f.suffix.lower() in supported_extensions
+        )
 
         if not input_files:
             msg = t("message.packer.no_supported_files_found", extensions=', '.join(supported_extensions))
             log(f"⚠️ {t('common.warning')}: {msg}")
             return False, msg
 
+        # 同名贴图存在多个格式的文件时，按 TEXTURE_FILE_PRIORITY 只保留一个，其余文件忽略
+        chosen_textures: dict[str, Path] = {}
+        for f in input_files:
+            if f.suffix.lower() not in texture_suffixes:
+                continue
+            chosen = chosen_textures.get(f.stem)
+            if chosen is None or (
+                TEXTURE_FILE_PRIORITY.index(f.suffix.lower()) < TEXTURE_FILE_PRIORITY.index(chosen.suffix.lower())
+            ):
+                chosen_textures[f.stem] = f
+        ignored_files = [
+            f for f in input_files
+            if f.suffix.lower() in texture_suffixes and chosen_textures[f.stem] != f
+        ]
+        for f in ignored_files:
+            log(f"⚠️ {t('common.warning')}: {t('log.packer.duplicate_texture_ignored', file=f.name, used=chosen_textures[f.stem].name)}")
+        input_files = [f for f in input_files if f not in ignored_files]
+
+        # 先收集目标 bundle 中的贴图和文本资源名称，只需读取每个对象开头的名称字段
+        texture_names: set[str] = set()
+        textasset_names: set[str] = set()
+        for obj in env.objects:
+            if obj.type == AssetType.Texture2D:
+                texture_names.add(_peek_name(obj))
+            elif obj.type == AssetType.TextAsset:
+                textasset_names.add(_peek_name(obj))
+
+        # 文件对应的资源键：贴图文件使用不含后缀的文件名，其他文件使用完整文件名
+        file_keys: dict[Path, AssetKey] = {
+            f: f.stem if f.suffix.lower() in texture_suffixes else f.name for f in input_files
+        }
+        all_keys = set(file_keys.values())
+        # 只读取在 bundle 中能找到同名资源的文件
+        input_files = [
+            f for f in input_files
+            if file_keys[f] in (texture_names if f.suffix.lower() in texture_suffixes else textasset_names)
+        ]
+
+        # 原始贴图文件只读取编码数据，只有与目标贴图的编码参数不一致时才解码
+        images: dict[Path, AssetContent] = {}
+        raw_suffix = TEXTURE_FILE_SUFFIXES["raw"]
+        for file_path in input_files:
+            if file_path.suffix.lower() == raw_suffix:
+                encoded_texture = EncodedTexture.read(file_path)
+                images[file_path] = LazyAssetContent(
+                    encoded_texture.to_image, AssetType.Texture2D.name, source=encoded_texture
+                )
+
+        # PIL 解码图片时会释放 GIL，因此可以用线程池并行解码
+        image_files = [
+            f for f in input_files
+            if f.suffix.lower() in texture_suffixes and f.suffix.lower() != raw_suffix
+        ]
+        if lazy_images:
+            for file_path in image_files:
+                images[file_path] = LazyAssetContent(
+                    lambda file_path=file_path: _load_rgba_image(file_path), AssetType.Texture2D.name
+                )
+        elif image_files:
+            with ThreadPoolExecutor(max_workers=max(1, save_options.encode_workers)) as executor:
+                images.update(zip(image_files, executor.map(_load_rgba_image, image_files)))
+
         for file_path in input_files:
-            asset_key: AssetKey
+            asset_key = file_keys[file_path]
             content: AssetContent
-            if file_path.suffix.lower() == ".png":
-                asset_key = file_path.stem
-                content = Image.open(file_path).convert("RGBA")
+            if file_path.suffix.lower() in texture_suffixes:
+                content = images[file_path]
             else: # .skel, .atlas
-                asset_key = file_path.name
                 with open(file_path, "rb") as f:
                     content = f.read()
                 
@@ -676,17 +2017,21 @@ def process_asset_packing(
                     )
             replacement_map[asset_key] = content
         
-        original_tasks_count = len(replacement_map)
+        original_tasks_count = len(all_keys)
         log(t("log.packer.found_files_to_process", count=original_tasks_count))
 
         # 2. 定义用于在 bundle 中查找资源的 key 生成函数
-        def key_func(obj: UnityPy.classes.Object, data: Any) -> AssetKey | None:
+        def key_func(obj: UnityPy.classes.Object) -> AssetKey | None:
             if obj.type in {AssetType.Texture2D, AssetType.TextAsset}:
-                return data.m_Name
+                return _peek_name(obj)
             return None
 
         # 3. 应用替换
-        replacement_count, replaced_assets_log, unmatched_keys = _apply_replacements(env, replacement_map, key_func, log)
+        replacement_count, replaced_assets_log, unmatched_keys = _apply_replacements(
+            env, replacement_map, key_func, log, save_options.encode_workers, save_options.texture_cache
+        )
+        # 没有被读取的文件同样属于未匹配
+        unmatched_keys |= all_keys - replacement_map.keys()
 
         if replacement_count == 0:
             log(f"⚠️ {t('common.warning')}: {t('log.packer.no_assets_packed')}")
@@ -704,11 +2049,9 @@ def process_asset_packing(
         if unmatched_keys:
             log(f"⚠️ {t('common.warning')}: {t('log.packer.unmatched_files_warning')}:")
             # 为了找到原始文件名，我们需要反向查找
-            original_filenames = {
-                f.stem if f.suffix.lower() == '.png' else f.name: f.name for f in input_files
-            }
+            original_filenames = {key: f.name for f, key in file_keys.items()}
             for key in sorted(unmatched_keys):
-                log(f"  - {original_filenames.get(key, key)} ({t('log.packer.attempted_match', key=key)})")
+                log(f"  - {original_filenames.get(key, key)} ({t('log.packer.attempted_match', name=key)})")
 
         # 4. 保存和修正
         output_path = output_dir / target_bundle_path.name
@@ -717,7 +2060,8 @@ def process_asset_packing(
             output_path=output_path,
             original_bundle_path=target_bundle_path,
             save_options=save_options,
-            log=log
+            log=log,
+            original_crc=target_crc
         )
 
         if not save_ok:
@@ -731,17 +2075,114 @@ def process_asset_packing(
         log(traceback.format_exc())
         return False, t("message.error_during_process", error=e)
 
+def _export_texture_job(
+    image_data: bytes,
+    width: int,
+    height: int,
+    texture_format: int,
+    version: tuple[int, int, int, int],
+    platform: int,
+    platform_blob: Any,
+    dest_path: Path,
+    file_format: TextureFileFormat,
+    compress_level: int,
+    optimize: bool,
+) -> None:
+    """
+    将已编码的贴图数据解码并保存为指定格式的图片，可以在子进程中执行。
+    与 Texture2D.image 使用相同的解码函数。
+    """
+    from UnityPy.export import Texture2DConverter
+
+    image = Texture2DConverter.parse_image_data(image_data, width, height, texture_format, version, platform, platform_blob)
+    _save_texture_file(image.convert("RGBA"), dest_path, file_format, compress_level, optimize)
+
+class _TextureExporter:
+    """
+    执行贴图导出任务 (输出路径, _export_texture_job 的参数)，按提交顺序输出日志。
+    workers 不大于1时在提交时直接解码并保存，同一时间只保留一张贴图的数据；
+    否则在进程池中并行处理，在途的任务最多为 workers 的两倍，避免整个 bundle 的贴图数据同时驻留内存。
+    只有一张贴图时不启动进程池。
+    """
+    def __init__(self, workers: int, log: LogFunc = no_log):
+        self.workers = workers
+        self.log = log
+        # 成功导出的文件路径
+        self.exported_paths: list[Path] = []
+        self._executor: ProcessPoolExecutor | None = None
+        # 等待完成的任务；进程池启动前，第一个任务以参数形式暂存
+        self._pending: deque[tuple[Path, Future | tuple]] = deque()
+
+    def __enter__(self) -> "_TextureExporter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        try:
+            while self._pending:
+                self._finish_oldest()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+
+    def submit(self, dest_path: Path, job: tuple) -> None:
+        if self.workers <= 1:
+            self._report(dest_path, self._run(job))
+            return
+
+        if self._executor is None:
+            if not self._pending:
+                self._pending.append((dest_path, job))
+                return
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            first_path, first_job = self._pending.popleft()
+            self._pending.append((first_path, self._executor.submit(_export_texture_job, *first_job)))
+
+        self._pending.append((dest_path, self._executor.submit(_export_texture_job, *job)))
+        while len(self._pending) > 2 * self.workers:
+            self._finish_oldest()
+
+    @staticmethod
+    def _run(job: tuple) -> Exception | None:
+        try:
+            _export_texture_job(*job)
+            return None
+        except Exception as e:
+            return e
+
+    def _finish_oldest(self) -> None:
+        dest_path, task = self._pending.popleft()
+        if isinstance(task, Future):
+            try:
+                task.result()
+                error = None
+            except Exception as e:
+                error = e
+        else:
+            error = self._run(task)
+        self._report(dest_path, error)
+
+    def _report(self, dest_path: Path, error: Exception | None) -> None:
+        if error is None:
+            self.log(f"  - {dest_path.name}")
+            self.exported_paths.append(dest_path)
+        else:
+            self.log(f"  ❌ {t('log.extractor.extraction_failed', name=dest_path.stem, error=error)}")
+
 def process_asset_extraction(
     bundle_path: Path,
     output_dir: Path,
     asset_types_to_extract: set[str],
     downgrade_options: SpineDowngradeOptions | None = None,
     log: LogFunc = no_log,
+    extract_options: ExtractOptions | None = None,
 ) -> tuple[bool, str]:
     """
     从指定的 Bundle 文件中提取选定类型的资源到输出目录。
-    支持 Texture2D (保存为 .png) 和 TextAsset (按原名保存)。
+    支持 Texture2D (按 extract_options.texture_format 保存为 .png、.qoi、.tga、.rgba 或原始编码数据 .tex) 和 TextAsset (按原名保存)。
     如果启用了Spine降级选项，将自动处理Spine 4.x到3.8的降级。
+    未启用降级时资源直接写入输出目录；启用降级时先提取到输出目录中的临时目录，处理后再移动到输出目录。
+    启用增量提取时，原始数据哈希与输出目录中的清单一致且输出文件仍存在的资源不会被读取和解码。
+    Spine 降级需要成组处理资源，因此启用降级时不使用增量提取。
 
     Args:
         bundle_path: 目标 Bundle 文件的路径。
@@ -749,6 +2190,7 @@ def process_asset_extraction(
         asset_types_to_extract: 需要提取的资源类型集合 (如 {"Texture2D", "TextAsset"})。
         downgrade_options: Spine资源降级的选项。
         log: 日志记录函数。
+        extract_options: 提取选项（并行进程数、贴图输出格式、PNG 压缩设置、增量提取、名称过滤），默认为 ExtractOptions()。
 
     Returns:
         一个元组 (是否成功, 状态消息)。
@@ -765,36 +2207,115 @@ def process_asset_extraction(
 
         output_dir.mkdir(parents=True, exist_ok=True)
         downgrade_enabled = downgrade_options and downgrade_options.is_valid()
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_extraction_dir = Path(temp_dir)
-            log(f"  > {t('log.extractor.using_temp_dir', path=temp_extraction_dir)}")
-
-            # --- 阶段 1: 统一提取所有相关资源到临时目录 ---
-            log(f'\n--- {t("log.section.extract_to_temp")} ---')
+        extract_options = extract_options or ExtractOptions()
+        texture_suffix = TEXTURE_FILE_SUFFIXES[extract_options.texture_format]
+        manifest = None
+        if extract_options.incremental:
+            if downgrade_enabled:
+                log(f"  > {t('log.extractor.incremental_disabled_by_downgrade')}")
+            else:
+                manifest = ExtractionManifest(output_dir)
+
+        # 只有 Spine 降级需要临时目录；临时目录建在输出目录中，之后移动文件只需重命名
+        staging = tempfile.TemporaryDirectory(dir=output_dir) if downgrade_enabled else nullcontext()
+        with staging as temp_dir:
+            if temp_dir:
+                extraction_dir = Path(temp_dir)
+                log(f"  > {t('log.extractor.using_temp_dir', path=extraction_dir)}")
+                # --- 阶段 1: 统一提取所有相关资源到临时目录 ---
+                log(f'\n--- {t("log.section.extract_to_temp")} ---')
+            else:
+                extraction_dir = output_dir
+                # --- 阶段 1: 直接提取所有相关资源到输出目录 ---
+                log(f'\n--- {t("log.section.extract_to_output")} ---')
             extraction_count = 0
-            for obj in env.objects:
-                if obj.type.name not in asset_types_to_extract:
-                    continue
-                try:
-                    data = obj.read()
-                    resource_name = getattr(data, 'm_Name', None)
-                    if not resource_name:
-                        log(f"  > {t('log.extractor.skipping_unnamed', type=obj.type.name)}")
+            skipped_count = 0
+            # 输出文件名 -> 资源的原始数据哈希，只有成功写入的文件才会记录到清单中
+            asset_hashes: dict[str, str] = {}
+            written_names: set[str] = set()
+            # 贴图的解码和图片编码最耗时，交给导出器处理（可能并行）
+            with _TextureExporter(extract_options.workers, log) as texture_exporter:
+                for obj in env.objects:
+                    if obj.type.name not in asset_types_to_extract:
                         continue
-
-                    if obj.type == AssetType.TextAsset:
-                        dest_path = temp_extraction_dir / resource_name
-                        asset_bytes = data.m_Script.encode("utf-8", "surrogateescape")
-                        dest_path.write_bytes(asset_bytes)
-                    elif obj.type == AssetType.Texture2D:
-                        dest_path = temp_extraction_dir / f"{resource_name}.png"
-                        data.image.convert("RGBA").save(dest_path)
+                    # 用于错误日志的资源名称，每个对象单独设置，某个资源失败时只跳过该资源
+                    log_name = "N/A"
+                    try:
+                        peeked_name = _peek_name(obj)
+                        log_name = peeked_name or log_name
+                        if extract_options.name_filter and not fnmatch.fnmatch(
+                            (peeked_name or "").lower(), extract_options.name_filter.lower()
+                        ):
+                            continue
+                        if manifest is not None and obj.type in {AssetType.TextAsset, AssetType.Texture2D}:
+                            # 只读取名称和原始数据，哈希未变化时不需要读取和解码对象
+                            file_name = peeked_name
+                            if obj.type == AssetType.Texture2D:
+                                file_name = f"{file_name}{texture_suffix}"
+                            asset_hash = ExtractionManifest.hash_object(obj)
+                            if manifest.is_unchanged(file_name, asset_hash):
+                                skipped_count += 1
+                                continue
+                            asset_hashes[file_name] = asset_hash
+
+                        data = obj.read()
+                        resource_name = getattr(data, 'm_Name', None)
+                        if not resource_name:
+                            log(f"  > {t('log.extractor.skipping_unnamed', type=obj.type.name)}")
+                            continue
+
+                        if obj.type == AssetType.TextAsset:
+                            dest_path = extraction_dir / resource_name
+                            asset_bytes = data.m_Script.encode("utf-8", "surrogateescape")
+                            dest_path.write_bytes(asset_bytes)
+                        elif obj.type == AssetType.Texture2D:
+                            dest_path = extraction_dir / f"{resource_name}{texture_suffix}"
+                            if extract_options.texture_format == "raw":
+                                # 原始编码数据不需要解码，直接写入
+                                EncodedTexture.from_texture(obj).write(dest_path)
+                                log(f"  - {dest_path.name}")
+                                written_names.add(dest_path.name)
+                                extraction_count += 1
+                                continue
+                            texture_exporter.submit(dest_path, (
+                                bytes(data.get_image_data()),
+                                data.m_Width,
+                                data.m_Height,
+                                int(data.m_TextureFormat),
+                                obj.version,
+                                int(obj.platform),
+                                data.m_PlatformBlob,
+                                dest_path,
+                                extract_options.texture_format,
+                                extract_options.png_compress_level,
+                                extract_options.png_optimize,
+                            ))
+                            continue
                     
-                    log(f"  - {dest_path.name}")
-                    extraction_count += 1
-                except Exception as e:
-                    log(f"  ❌ {t('log.extractor.extraction_failed', name=getattr(data, 'm_Name', 'N/A'), error=e)}")
+                        log(f"  - {dest_path.name}")
+                        written_names.add(dest_path.name)
+                        extraction_count += 1
+                    except Exception as e:
+                        log(f"  ❌ {t('log.extractor.extraction_failed', name=log_name, error=e)}")
+
+            exported_paths = texture_exporter.exported_paths
+            extraction_count += len(exported_paths)
+
+            written_names.update(dest_path.name for dest_path in exported_paths)
+
+            if manifest is not None:
+                # 提取失败的资源不记录，下次提取时会重新尝试
+                for file_name, asset_hash in asset_hashes.items():
+                    if file_name in written_names:
+                        manifest.record(file_name, asset_hash)
+                manifest.save()
+                if skipped_count:
+                    log(f"  > {t('log.extractor.incremental_skipped', count=skipped_count)}")
+
+            if extraction_count == 0 and skipped_count:
+                msg = t("message.extractor.no_changed_assets", count=skipped_count)
+                log(f"✅ {msg}")
+                return True, msg
 
             if extraction_count == 0:
                 msg = t("message.extractor.no_assets_found")
@@ -802,14 +2323,10 @@ def process_asset_extraction(
                 return True, msg
 
             # --- 阶段 2: 处理并移动文件 ---
-            if not downgrade_enabled:
-                log(f'\n--- {t("log.section.move_to_output")} ---')
-                for item in temp_extraction_dir.iterdir():
-                    shutil.copy2(item, output_dir / item.name)
-            else:
+            if downgrade_enabled:
                 log(f'\n--- {t("log.section.process_spine_downgrade")} ---')
                 processed_files = set()
-                skel_files = list(temp_extraction_dir.glob("*.skel"))
+                skel_files = list(extraction_dir.glob("*.skel"))
 
                 if not skel_files:
                     log(f'  > {t("log.spine.no_skel_found")}')
@@ -824,7 +2341,7 @@ def process_asset_extraction(
                         continue
                     
                     # 标记此资产组中的所有文件为已处理
-                    png_paths = list(temp_extraction_dir.glob(f"{base_name}*.png"))
+                    png_paths = list(extraction_dir.glob(f"{base_name}*{texture_suffix}"))
                     processed_files.add(skel_path)
                     processed_files.add(atlas_path)
                     processed_files.update(png_paths)
@@ -835,15 +2352,15 @@ def process_asset_extraction(
                     )
                 
                 # --- 阶段 3: 复制剩余的独立文件 ---
-                remaining_files = [item for item in temp_extraction_dir.iterdir() if item not in processed_files]
+                remaining_files = [item for item in extraction_dir.iterdir() if item not in processed_files]
                 
                 if remaining_files:
                     log(f'\n--- {t("log.section.copy_standalone_files")} ---')
                     for item in remaining_files:
                         log(f"  - {t('log.extractor.copying_file', name=item.name)}")
-                        shutil.copy2(item, output_dir / item.name)
+                        os.replace(item, output_dir / item.name)
 
-        total_files_extracted = len(list(output_dir.iterdir()))
+        total_files_extracted = _count_extracted_files(output_dir)
         success_msg = t("message.extractor.extraction_complete", count=total_files_extracted)
         log(f"\n🎉 {success_msg}")
         return True, success_msg
@@ -853,6 +2370,157 @@ def process_asset_extraction(
         log(traceback.format_exc())
         return False, t("message.error_during_process", error=e)
 
+# 批量提取的汇总清单文件名，保存在批量提取的输出目录中
+EXTRACT_SUMMARY_FILE = "extract_summary.json"
+
+def _collect_bundle_files(bundle_source: Path | str) -> tuple[Path, list[Path]]:
+    """
+    收集批量提取的 bundle 文件，返回 (源根目录, 按路径排序的文件列表)。
+    bundle_source 为目录时递归查找其中所有的 .bundle 文件，根目录即该目录；
+    否则作为通配符模式（支持 **）匹配文件，根目录为模式中第一个通配符之前的目录部分。
+    """
+    source_path = Path(bundle_source)
+    if source_path.is_dir():
+        return source_path, sorted(path for path in source_path.rglob("*.bundle") if path.is_file())
+
+    root_parts = []
+    for part in source_path.parts[:-1]:
+        if glob.has_magic(part):
+            break
+        root_parts.append(part)
+    source_root = Path(*root_parts) if root_parts else Path(".")
+    bundle_files = sorted(Path(path) for path in glob.glob(str(bundle_source), recursive=True) if Path(path).is_file())
+    return source_root, bundle_files
+
+def _bulk_extraction_output_dir(output_dir: Path, source_root: Path, bundle_path: Path) -> Path:
+    """
+    批量提取时每个 bundle 的资源保存到输出目录中的子目录，
+    子目录保留 bundle 相对于源根目录的路径（包括文件名后缀），
+    因此不同目录下的同名 bundle，以及 `a.bundle` 与同级目录 `a/` 中的 bundle 都不会写入同一个目录。
+    """
+    try:
+        relative_path = bundle_path.relative_to(source_root)
+    except ValueError:
+        relative_path = Path(bundle_path.name)
+    return output_dir / relative_path
+
+def process_bulk_asset_extraction(
+    bundle_source: Path | str,
+    output_dir: Path,
+    asset_types_to_extract: set[str],
+    downgrade_options: SpineDowngradeOptions | None = None,
+    log: LogFunc = no_log,
+    progress_callback: Callable[[int, int, str], None] | None = None,
+    max_workers: int = 1,
+    extract_options: ExtractOptions | None = None,
+) -> tuple[int, int, list[str]]:
+    """
+    从目录或通配符模式匹配到的所有 bundle 文件中批量提取资源。
+    每个 bundle 的资源保存到输出目录中的子目录，子目录保留 bundle 相对于源目录的路径（例如 `sub/a.bundle/`），
+    全部处理完成后在输出目录中写入汇总清单 (extract_summary.json)，记录每个 bundle 的处理结果。
+
+    Args:
+        bundle_source: 包含 bundle 文件的目录（递归查找 .bundle 文件），或匹配 bundle 文件的通配符模式。
+        output_dir: 提取资源的保存目录。
+        asset_types_to_extract: 需要提取的资源类型集合。
+        downgrade_options: Spine资源降级的选项。
+        log: 日志记录函数。
+        progress_callback: 进度回调函数，接收 (当前索引, 总数, 文件名)。
+        max_workers: 并行处理的进程数，大于1时每个 bundle 在独立的进程中提取（见 _run_tasks_in_order）。
+        extract_options: 提取选项（贴图输出格式、增量提取、名称过滤等），默认为 ExtractOptions()。
+
+    Returns:
+        tuple[int, int, list[str]]: (成功计数, 失败计数, 失败任务详情列表)
+    """
+    extract_options = extract_options or ExtractOptions()
+    source_root, bundle_files = _collect_bundle_files(bundle_source)
+    total_files = len(bundle_files)
+    log(t("log.extractor.bulk_found_bundles", count=total_files, source=bundle_source))
+    if not bundle_files:
+        return 0, 0, []
+
+    bundle_output_dirs = [_bulk_extraction_output_dir(output_dir, source_root, bundle_path) for bundle_path in bundle_files]
+    # 输出目录不能重复，也不能互相嵌套，否则多个 bundle 会写入同一个目录和增量清单。
+    # 冲突的 bundle 直接记为失败，其余 bundle 照常提取
+    output_dir_set = set(bundle_output_dirs)
+    nested_parents = {
+        parent for bundle_output_dir in bundle_output_dirs for parent in bundle_output_dir.parents
+        if parent in output_dir_set
+    }
+    conflicts = {
+        i for i, bundle_output_dir in enumerate(bundle_output_dirs)
+        if bundle_output_dirs.count(bundle_output_dir) > 1
+        or bundle_output_dir in nested_parents
+        or any(parent in output_dir_set for parent in bundle_output_dir.parents)
+    }
+    pending = [i for i in range(total_files) if i not in conflicts]
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    results: list[tuple[bool, str]] = [(False, "")] * total_files
+    reported_count = 0
+
+    def report_start(i: int) -> None:
+        nonlocal reported_count
+        reported_count += 1
+        bundle_path = bundle_files[i]
+        if progress_callback:
+            progress_callback(reported_count, total_files, bundle_path.name)
+        log("\n" + "=" * 50)
+        log(t("log.status.processing_batch", current=reported_count, total=total_files, filename=bundle_path.name))
+
+    # 冲突的 bundle 不进行提取
+    for i in sorted(conflicts):
+        report_start(i)
+        message = t("message.extractor.bulk_output_conflict")
+        log(f"❌ {message}")
+        results[i] = (False, message)
+
+    def on_finish(task_index: int, result: tuple[bool, str] | None, error: str | None) -> None:
+        results[pending[task_index]] = result or (False, t("message.error_during_process", error=error))
+
+    _run_tasks_in_order(
+        [(bundle_files[i], bundle_output_dirs[i], asset_types_to_extract, downgrade_options) for i in pending],
+        partial(process_asset_extraction, extract_options=extract_options),
+        log,
+        on_start=lambda task_index: report_start(pending[task_index]),
+        on_finish=on_finish,
+        max_workers=max_workers,
+        # 已经按文件并行处理，每个进程内不再并行导出贴图
+        worker_func=partial(process_asset_extraction, extract_options=replace(extract_options, workers=1)),
+    )
+
+    # 写入汇总清单
+    summary = {
+        "source": str(bundle_source),
+        "asset_types": sorted(asset_types_to_extract),
+        "name_filter": extract_options.name_filter,
+        "texture_format": extract_options.texture_format,
+        "bundles": [
+            {
+                "bundle": str(bundle_path),
+                "output_dir": bundle_output_dir.relative_to(output_dir).as_posix(),
+                "success": success,
+                "message": message,
+                # 冲突的 bundle 没有提取，其输出目录中的文件属于其他 bundle
+                "file_count": 0 if i in conflicts else _count_extracted_files(bundle_output_dir),
+            }
+            for i, (bundle_path, bundle_output_dir, (success, message))
+            in enumerate(zip(bundle_files, bundle_output_dirs, results))
+        ],
+    }
+    summary_path = output_dir / EXTRACT_SUMMARY_FILE
+    with open(summary_path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+    log(t("log.extractor.bulk_summary_saved", path=summary_path))
+
+    success_count = sum(1 for success, _ in results if success)
+    failed_tasks = [
+        f"{bundle_path.name} - {message}"
+        for bundle_path, (success, message) in zip(bundle_files, results)
+        if not success
+    ]
+    return success_count, len(failed_tasks), failed_tasks
+
 def _extract_assets_from_bundle(
     env: UnityPy.Environment,
     asset_types_to_replace: set[str],
@@ -864,7 +2532,20 @@ def _extract_assets_from_bundle(
     从源 bundle 的 env 构建替换清单
     即其他函数中使用的replacement_map
     """
-    replacement_map: dict[AssetKey, AssetContent] = {}
+    return _extract_assets_with_keys(env, asset_types_to_replace, [key_func], spine_options, log)[0]
+
+def _extract_assets_with_keys(
+    env: UnityPy.Environment,
+    asset_types_to_replace: set[str],
+    key_funcs: list[KeyGeneratorFunc],
+    spine_options: SpineOptions | None,
+    log: LogFunc = no_log,
+) -> list[dict[AssetKey, AssetContent]]:
+    """
+    从源 bundle 的 env 构建多份替换清单，每个 key 生成函数对应一份。
+    每个资源只被读取和解码一次，各清单共享同一份内容。
+    """
+    replacement_maps: list[dict[AssetKey, AssetContent]] = [{} for _ in key_funcs]
     replace_all = "ALL" in asset_types_to_replace
 
     for obj in env.objects:
@@ -873,18 +2554,19 @@ def _extract_assets_from_bundle(
             continue
 
         try:
-            data = obj.read()
-            asset_key = key_func(obj, data)
-            if asset_key is None or not getattr(data, 'm_Name', None):
+            # 键和名称都只需要读取对象开头的字段，只有需要提取内容时才完整读取对象
+            asset_keys = [key_func(obj) for key_func in key_funcs]
+            resource_name = _peek_name(obj)
+            if not resource_name or all(asset_key is None for asset_key in asset_keys):
                 continue
             
             content: AssetContent | None = None
-            resource_name = data.m_Name
 
             if obj.type == AssetType.Texture2D:
-                content = data.image
+                # 贴图只在匹配成功时才解码
+                content = LazyAssetContent(lambda obj=obj: obj.read().image, obj.type.name, source=obj)
             elif obj.type == AssetType.TextAsset:
-                asset_bytes = data.m_Script.encode("utf-8", "surrogateescape")
+                asset_bytes = obj.read().m_Script.encode("utf-8", "surrogateescape")
                 if resource_name.lower().endswith('.skel'):
                     content = _handle_skel_upgrade(
                         skel_bytes=asset_bytes,
@@ -899,14 +2581,17 @@ def _extract_assets_from_bundle(
                 content = obj.get_raw_data()
 
             if content is not None:
-                replacement_map[asset_key] = content
+                for replacement_map, asset_key in zip(replacement_maps, asset_keys):
+                    if asset_key is not None:
+                        replacement_map[asset_key] = content
         except Exception as e:
             log(f"  > ⚠️ {t('log.extractor.extraction_failed', name=getattr(obj.read(), 'm_Name', 'N/A'), error=e)}")
 
     if replace_all:
-        replacement_map["__mode__"] = {"ALL"}
+        for replacement_map in replacement_maps:
+            replacement_map["__mode__"] = {"ALL"}
 
-    return replacement_map
+    return replacement_maps
 
 def _b2b_replace(
     old_bundle_path: Path,
@@ -914,63 +2599,67 @@ def _b2b_replace(
     asset_types_to_replace: set[str],
     spine_options: SpineOptions | None = None,
     log: LogFunc = no_log,
-) -> tuple[UnityPy.Environment | None, int]:
+    encode_workers: int = 1,
+    compute_crc: bool = True,
+    use_texture_cache: bool = True,
+) -> tuple[UnityPy.Environment | None, int, int | None]:
     """
     执行 Bundle-to-Bundle 的核心替换逻辑。
     asset_types_to_replace: 要替换的资源类型集合（如 {"Texture2D", "TextAsset", "Mesh"} 的子集 或 {"ALL"}）
-    按顺序尝试多种匹配策略（path_id, name_type），一旦有策略成功替换了至少一个资源，就停止并返回结果。
-    返回一个元组 (modified_env, replacement_count)，如果失败则 modified_env 为 None。
+    按优先级使用多种匹配策略（path_id, name_type），只应用第一个成功替换了至少一个资源的策略。
+    旧版 bundle 中的资源只提取一次，新版 bundle 也只遍历一次，同时计算所有策略的匹配结果。
+    返回一个元组 (modified_env, replacement_count, new_bundle_crc)，如果失败则 modified_env 为 None。
+    new_bundle_crc 是加载新版 bundle 时计算的原始文件CRC，用于保存时的CRC修正；compute_crc 为 False 时为 None。
     """
     # 1. 加载 bundles
     log(t("log.b2b.extracting_from_old_bundle", types=', '.join(asset_types_to_replace)))
     old_env = load_bundle(old_bundle_path, log)
     if not old_env:
-        return None, 0
+        return None, 0, None
     
     log(t("log.b2b.loading_new_bundle"))
-    new_env = load_bundle(new_bundle_path, log)
+    new_env, new_bundle_crc = load_bundle_with_crc(new_bundle_path, log, compute_crc)
     if not new_env:
-        return None, 0
+        return None, 0, None
 
     # 定义匹配策略
     strategies: list[tuple[str, KeyGeneratorFunc]] = [
-        ('path_id', lambda obj, data: obj.path_id),
-        ('name_type', lambda obj, data: (data.m_Name, obj.type.name))
+        ('path_id', lambda obj: obj.path_id),
+        ('name_type', lambda obj: (_peek_name(obj), obj.type.name))
     ]
 
-    for name, key_func in strategies:
+    # 2. 从旧版 bundle 一次性构建所有策略的“替换清单”
+    log(f'  > {t("log.b2b.extracting_from_old_bundle_simple")}')
+    old_assets_maps = _extract_assets_with_keys(
+        old_env, asset_types_to_replace, [key_func for _, key_func in strategies], spine_options, log
+    )
+
+    strategy_maps: list[tuple[str, KeyGeneratorFunc, dict[AssetKey, AssetContent]]] = []
+    for (name, key_func), old_assets_map in zip(strategies, old_assets_maps):
         log(f'\n{t("log.b2b.trying_strategy", name=name)}')
-        
-        # 2. 根据当前策略从旧版 bundle 构建“替换清单”
-        log(f'  > {t("log.b2b.extracting_from_old_bundle_simple")}')
-        old_assets_map = _extract_assets_from_bundle(
-            old_env, asset_types_to_replace, key_func, spine_options, log
-        )
-        
         if not old_assets_map:
             log(f"  > ⚠️ {t('common.warning')}: {t('log.b2b.strategy_no_assets_found', name=name)}")
             continue
-
         log(f'  > {t("log.b2b.extraction_complete", name=name, count=len(old_assets_map))}')
+        strategy_maps.append((name, key_func, old_assets_map))
 
-        # 3. 根据当前策略应用替换
-        log(f'  > {t("log.b2b.writing_to_new_bundle")}')
-        
-        replacement_count, replaced_logs, _ \
-        = _apply_replacements(new_env, old_assets_map, key_func, log)
-        
-        # 4. 如果当前策略成功替换了至少一个资源，就结束
-        if replacement_count > 0:
+    # 3. 遍历一次新版 bundle，按优先级应用第一个成功的策略
+    if strategy_maps:
+        log(f'\n  > {t("log.b2b.writing_to_new_bundle")}')
+        name, replacement_count, replaced_logs = _apply_replacements_by_priority(
+            new_env, strategy_maps, log, encode_workers, use_texture_cache
+        )
+
+        # 4. 如果有策略成功替换了至少一个资源，就结束
+        if name is not None:
             log(f"\n✅ {t('log.b2b.strategy_success', name=name, count=replacement_count)}:")
             for item in replaced_logs:
                 log(f"  - {item}")
-            return new_env, replacement_count
-
-        log(f'  > {t("log.b2b.strategy_no_match", name=name)}')
+            return new_env, replacement_count, new_bundle_crc
 
     # 5. 所有策略都失败了
     log(f"\n⚠️ {t('common.warning')}: {t('log.b2b.all_strategies_failed', types=', '.join(asset_types_to_replace))}")
-    return None, 0
+    return None, 0, None
 
 def process_mod_update(
     old_mod_path: Path,
@@ -1012,12 +2701,15 @@ def process_mod_update(
 
         # 进行Bundle to Bundle 替换
         log(f'\n--- {t("log.section.b2b_replace")} ---')
-        modified_env, replacement_count = _b2b_replace(
+        modified_env, replacement_count, new_bundle_crc = _b2b_replace(
             old_bundle_path=old_mod_path, 
             new_bundle_path=new_bundle_path, 
             asset_types_to_replace=asset_types_to_replace, 
             spine_options=spine_options,
-            log = log
+            log = log,
+            encode_workers=save_options.encode_workers,
+            compute_crc=save_options.perform_crc,
+            use_texture_cache=save_options.texture_cache
         )
 
         if not modified_env:
@@ -1034,7 +2726,8 @@ def process_mod_update(
             output_path=output_path,
             original_bundle_path=new_bundle_path,
             save_options=save_options,
-            log=log
+            log=log,
+            original_crc=new_bundle_crc
         )
 
         if not save_ok:
@@ -1049,6 +2742,74 @@ def process_mod_update(
         log(traceback.format_exc())
         return False, t("message.error_during_process", error=e)
 
+def _process_batch_item(
+    old_mod_path: Path,
+    search_paths: list[Path],
+    output_dir: Path,
+    asset_types_to_replace: set[str],
+    save_options: SaveOptions,
+    spine_options: SpineOptions | None,
+    index: BundleIndex,
+    log: LogFunc = no_log,
+) -> tuple[bool, str]:
+    """
+    批量更新中单个Mod文件的处理流程：查找新版文件 -> 替换 -> 保存与CRC修正。
+    返回 (是否成功, 失败时的任务详情) 的元组。
+    """
+    filename = old_mod_path.name
+
+    # 查找对应的新资源文件
+    new_bundle_path, find_message = find_new_bundle_path(
+        old_mod_path, search_paths, log, index
+    )
+
+    if not new_bundle_path:
+        log(f'❌ {t("log.search.find_failed", message=find_message)}')
+        return False, f"{filename} - {t('log.search.find_failed', message=find_message)}"
+
+    # 执行Mod更新处理
+    success, process_message = process_mod_update(
+        old_mod_path=old_mod_path,
+        new_bundle_path=new_bundle_path,
+        output_dir=output_dir,
+        asset_types_to_replace=asset_types_to_replace,
+        save_options=save_options,
+        spine_options=spine_options,
+        log=log
+    )
+
+    if success:
+        log(f'✅ {t("log.mod_update.process_success", filename=filename)}')
+        return True, ""
+
+    log(f'❌ {t("log.mod_update.process_failed", filename=filename, message=process_message)}')
+    return False, f"{filename} - {process_message}"
+
+# 批量更新工作进程中共用的资源索引，由 _init_batch_worker_index 创建
+_worker_index: BundleIndex | None = None
+
+def _init_batch_worker_index() -> None:
+    """批量更新工作进程的初始化函数，创建进程内共用的资源索引。"""
+    global _worker_index
+    _worker_index = BundleIndex()
+
+def _process_batch_item_in_worker(
+    old_mod_path: Path,
+    search_paths: list[Path],
+    output_dir: Path,
+    asset_types_to_replace: set[str],
+    save_options: SaveOptions,
+    spine_options: SpineOptions | None,
+    log: LogFunc = no_log,
+) -> tuple[bool, str]:
+    """在工作进程中处理单个Mod文件，使用进程内共用的资源索引。"""
+    # 已经按文件并行处理，每个进程内不再并行压缩和编码
+    save_options = replace(save_options, compress_workers=1, encode_workers=1)
+    return _process_batch_item(
+        old_mod_path, search_paths, output_dir, asset_types_to_replace,
+        save_options, spine_options, _worker_index, log
+    )
+
 def process_batch_mod_update(
     mod_file_list: list[Path],
     search_paths: list[Path],
@@ -1058,6 +2819,7 @@ def process_batch_mod_update(
     spine_options: SpineOptions | None,
     log: LogFunc = no_log,
     progress_callback: Callable[[int, int, str], None] | None = None,
+    max_workers: int = 1,
 ) -> tuple[int, int, list[str]]:
     """
     执行批量Mod更新的核心逻辑。
@@ -1072,6 +2834,8 @@ def process_batch_mod_update(
         log: 日志记录函数。
         progress_callback: 进度回调函数，用于更新UI。
                            接收 (当前索引, 总数, 文件名)。
+        max_workers: 并行处理的进程数。大于1时每个Mod文件在独立的进程中处理，
+                     各文件的日志会在其处理完成后按原顺序输出。
 
     Returns:
         tuple[int, int, list[str]]: (成功计数, 失败计数, 失败任务详情列表)
@@ -1081,46 +2845,45 @@ def process_batch_mod_update(
     fail_count = 0
     failed_tasks = []
 
-    # 遍历每个旧Mod文件
-    for i, old_mod_path in enumerate(mod_file_list):
-        current_progress = i + 1
-        filename = old_mod_path.name
-        
+    # 整个批次共用一个索引，资源目录只需遍历一次
+    index = BundleIndex()
+    if max_workers > 1 and total_files > 1:
+        # 先在主进程中刷新索引，工作进程只需读取
+        index.refresh(search_paths, log=log)
+
+    def on_start(i: int) -> None:
+        filename = mod_file_list[i].name
         if progress_callback:
-            progress_callback(current_progress, total_files, filename)
+            progress_callback(i + 1, total_files, filename)
 
         log("\n" + "=" * 50)
-        log(t("log.status.processing_batch", current=current_progress, total=total_files, filename=filename))
-
-        # 查找对应的新资源文件
-        new_bundle_path, find_message = find_new_bundle_path(
-            old_mod_path, search_paths, log
-        )
-
-        if not new_bundle_path:
-            log(f'❌ {t("log.search.find_failed", message=find_message)}')
-            fail_count += 1
-            failed_tasks.append(f"{filename} - {t('log.search.find_failed', message=find_message)}")
-            continue
+        log(t("log.status.processing_batch", current=i + 1, total=total_files, filename=filename))
 
-        # 执行Mod更新处理
-        success, process_message = process_mod_update(
-            old_mod_path=old_mod_path,
-            new_bundle_path=new_bundle_path,
-            output_dir=output_dir,
-            asset_types_to_replace=asset_types_to_replace,
-            save_options=save_options,
-            spine_options=spine_options,
-            log=log
+    # 单个文件出错（如索引数据库被锁定、资源目录被移除）不影响后续文件
+    def on_finish(i: int, result: tuple[bool, str] | None, error: str | None) -> None:
+        nonlocal success_count, fail_count
+        success, failed_detail = result or (
+            False, f"{mod_file_list[i].name} - {t('message.error_during_process', error=error)}"
         )
-
         if success:
-            log(f'✅ {t("log.mod_update.process_success", filename=filename)}')
             success_count += 1
         else:
-            log(f'❌ {t("log.mod_update.process_failed", filename=filename, message=process_message)}')
             fail_count += 1
-            failed_tasks.append(f"{filename} - {process_message}")
+            failed_tasks.append(failed_detail)
+
+    _run_tasks_in_order(
+        [
+            (old_mod_path, search_paths, output_dir, asset_types_to_replace, save_options, spine_options)
+            for old_mod_path in mod_file_list
+        ],
+        partial(_process_batch_item, index=index),
+        log,
+        on_start=on_start,
+        on_finish=on_finish,
+        max_workers=max_workers,
+        worker_func=_process_batch_item_in_worker,
+        worker_setup=_init_batch_worker_index,
+    )
 
     return success_count, fail_count, failed_tasks
 
@@ -1159,6 +2922,7 @@ def find_all_jp_counterparts(
     global_bundle_path: Path,
     search_dirs: list[Path],
     log: LogFunc = no_log,
+    index: BundleIndex | None = None,
 ) -> list[Path]:
     """
     根据国际服bundle文件，查找所有相关的日服 bundle 文件。
@@ -1168,39 +2932,40 @@ def find_all_jp_counterparts(
         global_bundle_path: 国际服bundle文件的路径。
         search_dirs: 用于查找的目录列表。
         log: 日志记录函数。
+        index: 资源索引，未传入时使用默认的索引文件。
 
     Returns:
-        找到的日服文件路径列表。
+        找到的日服文件路径列表，按与国际服文件重合的资源数量从高到低排列。
     """
     log(t("log.jp_convert.searching_jp_counterparts", name=global_bundle_path.name))
 
     # 1. 从国际服文件名提取前缀
     prefix, prefix_message = get_filename_prefix(global_bundle_path.name, log)
     if not prefix:
-        log(f'  > ❌ {t("log.search.find_failed")}: {prefix_message}')
+        log(f'  > ❌ {t("log.search.find_failed", message=prefix_message)}')
         return []
     
     log(f"  > {t('log.search.using_prefix', prefix=prefix)}")
 
+    # 2. 从索引中查找匹配前缀的所有文件，排除自身和重名文件
+    if index is None:
+        index = BundleIndex()
+    index.refresh(search_dirs, log=log)
+
     jp_files: list[Path] = []
-    seen_names = set()
+    seen_names = {global_bundle_path.name}
+    for file_path in index.find_candidates(prefix, search_dirs):
+        if file_path.name not in seen_names:
+            jp_files.append(file_path)
+            seen_names.add(file_path.name)
 
-    # 2. 在搜索目录中查找匹配前缀的所有文件
-    for search_dir in search_dirs:
-        if not (search_dir.exists() and search_dir.is_dir()):
-            continue
-        
-        for file_path in search_dir.iterdir():
-            # 排除自身
-            if file_path.name == global_bundle_path.name:
-                continue
-                
-            # 检查文件是否以通用前缀开头，且是 bundle 文件
-            if file_path.is_file() and file_path.name.startswith(prefix) and file_path.suffix == '.bundle':
-                if file_path.name not in seen_names:
-                    jp_files.append(file_path)
-                    seen_names.add(file_path.name)
-                    log(f"  > {t('log.jp_convert.found_match', path=file_path.name)}")
+    # 3. 通过倒排索引按重合的资源数量排序，没有重合的文件保留在末尾
+    ranked = index.rank_by_overlap(index.get_assets(global_bundle_path, log), jp_files, log)
+    overlap = {path: count for path, count in ranked}
+    jp_files.sort(key=lambda path: -overlap.get(path, 0))
+
+    for file_path in jp_files:
+        log(f"  > {t('log.jp_convert.found_match', path=file_path.name)}")
 
     return jp_files
 
@@ -1237,7 +3002,7 @@ def process_jp_to_global_conversion(
         log(f'\n--- {t("log.section.extracting_from_jp")} ---')
         replacement_map: dict[AssetKey, AssetContent] = {}
         # 定义资源标识符为 (资源名, 资源类型)
-        key_func: KeyGeneratorFunc = lambda obj, data: (getattr(data, 'm_Name', None), obj.type.name)
+        key_func: KeyGeneratorFunc = lambda obj: (_peek_name(obj), obj.type.name)
         
         # 根据日服文件名动态确定要提取的资源类型
         asset_types = _get_asset_types_from_jp_filenames(jp_bundle_paths)
@@ -1265,12 +3030,12 @@ def process_jp_to_global_conversion(
 
         # 2. 加载国际服 base 并应用替换
         log(f'\n--- {t("log.section.applying_to_global")} ---')
-        global_env = load_bundle(global_bundle_path, log)
+        global_env, global_crc = load_bundle_with_crc(global_bundle_path, log, save_options.perform_crc)
         if not global_env:
             return False, t("message.jp_convert.load_global_failed")
         
         replacement_count, replaced_logs, _ = _apply_replacements(
-            global_env, replacement_map, key_func, log
+            global_env, replacement_map, key_func, log, save_options.encode_workers, save_options.texture_cache
         )
         
         if replacement_count == 0:
@@ -1288,7 +3053,8 @@ def process_jp_to_global_conversion(
             output_path=output_path,
             original_bundle_path=global_bundle_path,
             save_options=save_options,
-            log=log
+            log=log,
+            original_crc=global_crc
         )
         
         if not save_ok:
@@ -1339,7 +3105,7 @@ def process_global_to_jp_conversion(
             return False, t("message.jp_convert.load_global_source_failed")
         
         log(f'\n--- {t("log.section.extracting_from_global")} ---')
-        key_func: KeyGeneratorFunc = lambda obj, data: (getattr(data, 'm_Name', None), obj.type.name)
+        key_func: KeyGeneratorFunc = lambda obj: (_peek_name(obj), obj.type.name)
 
         # 根据日服模板文件名确定要提取哪些类型的资源
         asset_types = _get_asset_types_from_jp_filenames(jp_template_paths)
@@ -1362,14 +3128,14 @@ def process_global_to_jp_conversion(
         for i, jp_template_path in enumerate(jp_template_paths, 1):
             log(t("log.processing_filename_with_progress", current=i, total=total_files, name=jp_template_path.name))
             
-            template_env = load_bundle(jp_template_path, log)
+            template_env, template_crc = load_bundle_with_crc(jp_template_path, log, save_options.perform_crc)
             if not template_env:
                 log(f"  > ❌ {t('message.load_failed')}: {jp_template_path.name}")
                 continue
 
             # 应用替换，函数会自动匹配并替换存在于模板中的资源
             replacement_count, replaced_logs, _ = _apply_replacements(
-                template_env, source_replacement_map, key_func, log
+                template_env, source_replacement_map, key_func, log, save_options.encode_workers, save_options.texture_cache
             )
             
             if replacement_count > 0:
@@ -1383,7 +3149,8 @@ def process_global_to_jp_conversion(
                     output_path=output_path,
                     original_bundle_path=jp_template_path,
                     save_options=save_options,
-                    log=log
+                    log=log,
+                    original_crc=template_crc
                 )
                 if save_ok:
                     log(f"  ✅ {t('log.file.saved', path=output_path)}")
@@ -42,6 +42,7 @@ class App(tk.Frame):
         self.enable_crc_correction_var.set(True)
         self.create_backup_var.set(True)
         self.compression_method_var.set("lzma")
+        self.max_workers_var.set(1)
         
         # JP/GB转换自动搜索选项
         self.auto_search_var.set(True)
@@ -72,6 +73,7 @@ class App(tk.Frame):
         self.enable_crc_correction_var = tk.BooleanVar()
         self.create_backup_var = tk.BooleanVar()
         self.compression_method_var = tk.StringVar()
+        self.max_workers_var = tk.IntVar()
         # JP/GB转换自动搜索选项
         self.auto_search_var = tk.BooleanVar()
         # 一键更新的资源类型选项
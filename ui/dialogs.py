@@ -1,5 +1,6 @@
 # ui/dialogs.py
 
+import os
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from pathlib import Path
@@ -76,6 +77,13 @@ class SettingsDialog(tk.Toplevel):
         language_combo = UIComponents.create_combobox(language_frame, textvariable=self.app.language_var, values=["zh-CN", "debug"], width=10)
         language_combo.pack(side=tk.LEFT)
         language_combo.bind("<<ComboboxSelected>>", self._on_language_changed)
+
+        # 并行任务数，用于批量处理和数据块压缩
+        workers_label = tk.Label(language_frame, text=t("ui.label.max_workers"), font=Theme.INPUT_FONT, bg=Theme.FRAME_BG, fg=Theme.TEXT_NORMAL)
+        workers_label.pack(side=tk.LEFT, padx=(20, 10))
+
+        workers_combo = UIComponents.create_combobox(language_frame, textvariable=self.app.max_workers_var, values=[str(i) for i in range(1, (os.cpu_count() or 1) + 1)], width=5)
+        workers_combo.pack(side=tk.LEFT)
         
         # 选项设置
         global_options_frame = tk.LabelFrame(container, text=t("ui.settings.group_global"), font=Theme.FRAME_FONT, fg=Theme.TEXT_TITLE, bg=Theme.FRAME_BG, padx=5, pady=5)
@@ -197,7 +197,8 @@ class AssetExtractorTab(TabFrame):
             output_dir=output_dir,
             asset_types_to_extract=asset_types,
             downgrade_options=downgrade_options,
-            log=self.logger.log
+            log=self.logger.log,
+            extract_options=processing.ExtractOptions(workers=self.app.max_workers_var.get())
         )
         
         if success:
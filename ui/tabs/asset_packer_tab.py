@@ -103,7 +103,9 @@ class AssetPackerTab(TabFrame):
         save_options = processing.SaveOptions(
             perform_crc=self.app.enable_crc_correction_var.get(),
             enable_padding=self.app.enable_padding_var.get(),
-            compression=self.app.compression_method_var.get()
+            compression=self.app.compression_method_var.get(),
+            compress_workers=self.app.max_workers_var.get(),
+            encode_workers=self.app.max_workers_var.get()
         )
         
         spine_options = processing.SpineOptions(
@@ -199,8 +199,7 @@ class CrcToolTab(TabFrame):
             # 确定要计算的文件路径
             target_path = self.modified_path if self.modified_path else self.original_path
             
-            with open(target_path, "rb") as f: file_data = f.read()
-            crc_hex = f"{CRCUtils.compute_crc32(file_data):08X}"
+            crc_hex = f"{CRCUtils.get_file_crc32(target_path):08X}"
             
             self.logger.log(t(f"log.crc.file_crc32", crc=crc_hex))
             self.logger.status(t("log.status.calculation_done"))
@@ -215,11 +214,8 @@ class CrcToolTab(TabFrame):
         """计算两个文件的CRC32值，并判断是否匹配"""
         self.logger.status(t("common.processing"))
         try:
-            with open(self.original_path, "rb") as f: original_data = f.read()
-            with open(self.modified_path, "rb") as f: modified_data = f.read()
-
-            original_crc_hex = f"{CRCUtils.compute_crc32(original_data):08X}"
-            modified_crc_hex = f"{CRCUtils.compute_crc32(modified_data):08X}"
+            original_crc_hex = f"{CRCUtils.get_file_crc32(self.original_path):08X}"
+            modified_crc_hex = f"{CRCUtils.get_file_crc32(self.modified_path):08X}"
             
             self.logger.log(t("log.crc.modified_file_crc32", crc=modified_crc_hex))
             self.logger.log(t("log.crc.original_file_crc32", crc=original_crc_hex))
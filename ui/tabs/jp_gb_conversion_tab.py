@@ -175,7 +175,9 @@ class JpGbConversionTab(TabFrame):
         save_options = processing.SaveOptions(
             perform_crc=self.app.enable_crc_correction_var.get(),
             enable_padding=self.app.enable_padding_var.get(),
-            compression=self.app.compression_method_var.get()
+            compression=self.app.compression_method_var.get(),
+            compress_workers=self.app.max_workers_var.get(),
+            encode_workers=self.app.max_workers_var.get()
         )
         
         # 3. 调用处理函数
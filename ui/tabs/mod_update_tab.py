@@ -193,7 +193,9 @@ class ModUpdateTab(TabFrame):
         save_options = processing.SaveOptions(
             perform_crc=self.app.enable_crc_correction_var.get(),
             enable_padding=self.app.enable_padding_var.get(),
-            compression=self.app.compression_method_var.get()
+            compression=self.app.compression_method_var.get(),
+            compress_workers=self.app.max_workers_var.get(),
+            encode_workers=self.app.max_workers_var.get()
         )
         
         spine_options = processing.SpineOptions(
@@ -312,7 +314,9 @@ class ModUpdateTab(TabFrame):
         save_options = processing.SaveOptions(
             perform_crc=self.app.enable_crc_correction_var.get(),
             enable_padding=self.app.enable_padding_var.get(),
-            compression=self.app.compression_method_var.get()
+            compression=self.app.compression_method_var.get(),
+            compress_workers=self.app.max_workers_var.get(),
+            encode_workers=self.app.max_workers_var.get()
         )
         
         spine_options = processing.SpineOptions(
@@ -334,7 +338,8 @@ class ModUpdateTab(TabFrame):
             save_options=save_options,
             spine_options=spine_options,
             log=self.logger.log,
-            progress_callback=progress_callback
+            progress_callback=progress_callback,
+            max_workers=self.app.max_workers_var.get()
         )
         
         # 3. 处理结果并更新UI
@@ -244,6 +244,7 @@ class ConfigManager:
                 'enable_crc_correction': str(app_instance.enable_crc_correction_var.get()),
                 'create_backup': str(app_instance.create_backup_var.get()),
                 'compression_method': app_instance.compression_method_var.get(),
+                'max_workers': str(app_instance.max_workers_var.get()),
                 'auto_search': str(app_instance.auto_search_var.get())
             }
             
@@ -310,6 +311,8 @@ class ConfigManager:
                     app_instance.create_backup_var.set(self.config['GlobalOptions']['create_backup'].lower() == 'true')
                 if 'compression_method' in self.config['GlobalOptions']:
                     app_instance.compression_method_var.set(self.config['GlobalOptions']['compression_method'])
+                if 'max_workers' in self.config['GlobalOptions']:
+                    app_instance.max_workers_var.set(self.config['GlobalOptions'].getint('max_workers', fallback=1))
                 if 'auto_search' in self.config['GlobalOptions']:
                     app_instance.auto_search_var.set(self.config['GlobalOptions']['auto_search'].lower() == 'true')
             
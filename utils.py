@@ -3,17 +3,104 @@
 import binascii
 import os
 import re
+import sqlite3
+from contextlib import closing
 from pathlib import Path
 
 def no_log(message):
     """A dummy logger that does nothing."""
     pass
 
+# CRC32多项式: x^32 + x^26 + ... + 1
+CRC32_POLY = 0x104C11DB7
+
+# x^32 在模 CRC32_POLY 下的乘法逆元，即 CRCUtils._gf_modular_inverse(0x100000000, CRC32_POLY)
+# 该值是常量，预先计算以免每次修正都重新执行扩展欧几里得算法
+CRC32_X32_INVERSE = 0xCBF1ACDA
+
+# 字节位反转查找表，可直接用于 bytes.translate
+BIT_REVERSE_TABLE = bytes(int('{:08b}'.format(i)[::-1], 2) for i in range(256))
+
+CRC_CACHE_FILE = "crc_cache.db"
+
+class CRCCache:
+    """
+    文件CRC32值的持久化缓存，保存在 SQLite 数据库中。
+    以文件的绝对路径、大小和修改时间(mtime_ns)作为键，文件被修改后缓存自动失效。
+    每次操作都使用独立的数据库连接，因此可以在工作线程和子进程中使用。
+    数据库不可用时直接计算CRC，不会影响结果。
+    """
+
+    def __init__(self, db_path: Path | str = CRC_CACHE_FILE):
+        self.db_path = Path(db_path)
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        if not self._initialized:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS file_crc (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    crc INTEGER NOT NULL
+                )
+            """)
+            self._initialized = True
+        return conn
+
+    def lookup(self, path: Path) -> int | None:
+        """
+        返回缓存中记录的文件CRC32值。
+        文件不在缓存中、或大小和修改时间与缓存记录不一致时返回None。
+        """
+        stat = os.stat(path)
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT crc FROM file_crc WHERE path = ? AND size = ? AND mtime_ns = ?",
+                    (str(Path(path).resolve()), stat.st_size, stat.st_mtime_ns)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    def store(self, path: Path, crc: int) -> None:
+        """
+        记录文件当前的CRC32值，键为文件当前的大小和修改时间。
+        """
+        stat = os.stat(path)
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO file_crc (path, size, mtime_ns, crc) VALUES (?, ?, ?, ?)",
+                    (str(Path(path).resolve()), stat.st_size, stat.st_mtime_ns, crc)
+                )
+        except sqlite3.Error:
+            pass
+
+    def get_file_crc32(self, path: Path) -> int:
+        """
+        返回文件的CRC32值。
+        如果缓存中记录的大小和修改时间与文件一致，直接返回缓存值而不读取文件；否则流式计算并更新缓存。
+        """
+        crc = self.lookup(path)
+        if crc is None:
+            crc = CRCUtils.compute_file_crc32(path)
+            self.store(path, crc)
+        return crc
+
 class CRCUtils:
     """
     一个封装了CRC32计算和修正逻辑的工具类。
     """
 
+    # 流式计算文件CRC时每次读取的字节数
+    CHUNK_SIZE = 1024 * 1024
+
+    # 共享的文件CRC缓存，首次使用时创建
+    _cache: CRCCache | None = None
+
     # --- 公开的静态方法 ---
 
     @staticmethod
@@ -23,88 +110,126 @@ class CRCUtils:
         """
         return binascii.crc32(data) & 0xFFFFFFFF
 
+    @staticmethod
+    def compute_file_crc32(path: Path, chunk_size: int = CHUNK_SIZE) -> int:
+        """
+        以固定大小的块流式计算文件的CRC32值，不会将整个文件读入内存。
+        """
+        crc = 0
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        with open(path, "rb") as f:
+            while size := f.readinto(buffer):
+                crc = binascii.crc32(view[:size], crc)
+        return crc & 0xFFFFFFFF
+
+    @staticmethod
+    def get_crc_cache() -> CRCCache:
+        """
+        返回共享的文件CRC缓存。
+        """
+        if CRCUtils._cache is None:
+            CRCUtils._cache = CRCCache()
+        return CRCUtils._cache
+
+    @staticmethod
+    def get_file_crc32(path: Path) -> int:
+        """
+        获取文件的CRC32值，优先使用持久化缓存。
+        文件大小和修改时间未变化时不会重新读取文件。
+        """
+        return CRCUtils.get_crc_cache().get_file_crc32(path)
+
     @staticmethod
     def check_crc_match(source_1: Path | bytes, source_2: Path | bytes) -> bool:
         """
         检测两个文件或字节数据的CRC值是否匹配。
+        文件的CRC优先从缓存读取，否则流式计算；如果两个路径指向同一个文件，则直接返回True。
         返回True表示CRC值一致，False表示不一致。
         """
-        if isinstance(source_1, Path):
-            with open(str(source_1), "rb") as f:
-                data_1 = f.read()
-        else:
-            data_1 = source_1
-
-        if isinstance(source_2, Path):
-            with open(str(source_2), "rb") as f:
-                data_2 = f.read()
-        else:
-            data_2 = source_2
+        if isinstance(source_1, Path) and isinstance(source_2, Path) and os.path.samefile(source_1, source_2):
+            return True
 
-        crc_1 = CRCUtils.compute_crc32(data_1)
-        crc_2 = CRCUtils.compute_crc32(data_2)
+        crc_1 = CRCUtils._compute_source_crc32(source_1)
+        crc_2 = CRCUtils._compute_source_crc32(source_2)
         
         return crc_1 == crc_2
     
     @staticmethod
-    def apply_crc_fix(original_data: bytes, modified_data: bytes, enable_padding: bool = False) -> bytes | None:
+    def compute_crc_fix_suffix(original_crc: int, modified_crc: int, enable_padding: bool = False) -> bytes | None:
         """
-        计算修正CRC后的数据。
-        如果修正成功，返回修正后的完整字节数据；如果失败，返回None。
+        计算追加到修改后数据末尾、使其CRC等于original_crc的字节（不含填充为4字节，含填充为8字节）。
+        只需要修改后数据的CRC值，利用CRC32可以从已有状态继续计算的特性，不需要修改后数据本身。
+        如果修正失败，返回None。
         """
-        original_crc = CRCUtils.compute_crc32(original_data)
-        
         padding_bytes = b'\x08\x08\x08\x08' if enable_padding else b''
-        # 计算新数据加上4个空字节的CRC，为修正值留出空间
-        modified_crc = CRCUtils.compute_crc32(modified_data + padding_bytes + b'\x00\x00\x00\x00')
-
-        original_bytes = CRCUtils._u32_to_bytes_be(original_crc)
-        modified_bytes = CRCUtils._u32_to_bytes_be(modified_crc)
+        # 在已计算的CRC基础上继续计算填充和4个空字节，为修正值留出空间
+        zeroed_crc = binascii.crc32(padding_bytes + b'\x00\x00\x00\x00', modified_crc) & 0xFFFFFFFF
 
-        xor_result = CRCUtils._xor_bytes(original_bytes, modified_bytes)
-        reversed_bytes = CRCUtils._reverse_bits_in_bytes(xor_result)
-        k = CRCUtils._bytes_to_u32_be(reversed_bytes)
+        suffix = padding_bytes + CRCUtils._compute_correction_bytes(original_crc, zeroed_crc)
 
-        # CRC32多项式: x^32 + x^26 + ... + 1
-        crc32_poly = 0x104C11DB7
+        # 同样从已有状态继续计算，验证追加后的CRC
+        final_crc = binascii.crc32(suffix, modified_crc) & 0xFFFFFFFF
+        return suffix if final_crc == original_crc else None
 
-        correction_value = CRCUtils._gf_inverse(k, crc32_poly)
-        correction_bytes_raw = CRCUtils._u32_to_bytes_be(correction_value)
+    @staticmethod
+    def apply_crc_fix(original_data: bytes, modified_data: bytes, enable_padding: bool = False) -> bytes | None:
+        """
+        计算修正CRC后的数据。
+        如果修正成功，返回修正后的完整字节数据；如果失败，返回None。
+        只需要追加字节的场景应使用compute_crc_fix_suffix，避免复制整个数据。
+        """
+        suffix = CRCUtils.compute_crc_fix_suffix(
+            CRCUtils.compute_crc32(original_data),
+            CRCUtils.compute_crc32(modified_data),
+            enable_padding
+        )
+        return modified_data + suffix if suffix else None
 
-        # 反转每个字节内的位
-        correction_bytes = bytes(CRCUtils._reverse_byte_bits(b) for b in correction_bytes_raw)
+    @staticmethod
+    def manipulate_crc(original_path: Path, modified_path: Path, enable_padding: bool = False) -> bool:
+        """
+        修正modified_path文件的CRC，使其与original_path文件匹配。
+        两个文件都只被流式读取一次（original_path 的CRC可能直接来自缓存），修正字节直接追加到modified_path文件末尾，内存占用与文件大小无关。
+        """
+        suffix = CRCUtils.compute_crc_fix_suffix(
+            CRCUtils.get_file_crc32(original_path),
+            CRCUtils.compute_file_crc32(modified_path),
+            enable_padding
+        )
+        if not suffix:
+            return False
 
-        if enable_padding:
-            final_data = modified_data + padding_bytes + correction_bytes
-        else:
-            final_data = modified_data + correction_bytes
+        with open(modified_path, "ab") as f:
+            f.write(suffix)
+        return True
 
-        final_crc = CRCUtils.compute_crc32(final_data)
-        is_crc_match = (final_crc == original_crc)
+    # --- 内部使用的私有静态方法 ---
 
-        return final_data if is_crc_match else None
+    @staticmethod
+    def _compute_source_crc32(source: Path | bytes) -> int:
+        if isinstance(source, Path):
+            return CRCUtils.get_file_crc32(source)
+        return CRCUtils.compute_crc32(source)
 
     @staticmethod
-    def manipulate_crc(original_path: Path, modified_path: Path, enable_padding: bool = False) -> bool:
+    def _compute_correction_bytes(original_crc: int, modified_crc: int) -> bytes:
         """
-        修正modified_path文件的CRC，使其与original_path文件匹配。
-        此方法封装了apply_crc_fix方法，处理文件的读写操作。
+        计算4个修正字节。
+        modified_crc 是修改后数据末尾补上4个空字节后的CRC，用修正字节替换这4个空字节后，CRC将等于 original_crc。
         """
-        with open(str(original_path), "rb") as f:
-            original_data = f.read()
-        with open(str(modified_path), "rb") as f:
-            modified_data = f.read()
+        original_bytes = CRCUtils._u32_to_bytes_be(original_crc)
+        modified_bytes = CRCUtils._u32_to_bytes_be(modified_crc)
 
-        corrected_data = CRCUtils.apply_crc_fix(original_data, modified_data, enable_padding)
-        
-        if corrected_data:
-            with open(modified_path, "wb") as f:
-                f.write(corrected_data)
-            return True
-        
-        return False
+        xor_result = CRCUtils._xor_bytes(original_bytes, modified_bytes)
+        reversed_bytes = CRCUtils._reverse_bits_in_bytes(xor_result)
+        k = CRCUtils._bytes_to_u32_be(reversed_bytes)
 
-    # --- 内部使用的私有静态方法 ---
+        correction_value = CRCUtils._gf_inverse(k, CRC32_POLY)
+        correction_bytes_raw = CRCUtils._u32_to_bytes_be(correction_value)
+
+        # 反转每个字节内的位
+        return correction_bytes_raw.translate(BIT_REVERSE_TABLE)
 
     @staticmethod
     def _bytes_to_u32_be(b):
@@ -116,12 +241,8 @@ class CRCUtils:
 
     @staticmethod
     def _reverse_bits_in_bytes(b):
-        num = CRCUtils._bytes_to_u32_be(b)
-        rev = 0
-        for i in range(32):
-            if (num >> i) & 1:
-                rev |= 1 << (31 - i)
-        return CRCUtils._u32_to_bytes_be(rev)
+        # 整个32位整数的位反转 = 字节顺序反转 + 每个字节内的位反转
+        return b[::-1].translate(BIT_REVERSE_TABLE)
 
     @staticmethod
     def _gf_multiply(a, b):
@@ -177,8 +298,11 @@ class CRCUtils:
 
     @staticmethod
     def _gf_inverse(k, poly):
-        x32 = 0x100000000
-        inverse = CRCUtils._gf_modular_inverse(x32, poly)
+        if poly == CRC32_POLY:
+            inverse = CRC32_X32_INVERSE
+        else:
+            x32 = 0x100000000
+            inverse = CRCUtils._gf_modular_inverse(x32, poly)
         result = CRCUtils._gf_multiply_modular(k, inverse, poly, 32)
         return result
 
@@ -188,7 +312,7 @@ class CRCUtils:
 
     @staticmethod
     def _reverse_byte_bits(byte):
-        return int('{:08b}'.format(byte)[::-1], 2)
+        return BIT_REVERSE_TABLE[byte]
 
 def get_environment_info():
     """Collects and formats key environment details."""